@@ -149,6 +149,7 @@ class MainWindow(QMainWindow):
         self._decoder: Optional[DBCDecoder] = None
         self._parse_worker: Optional[ParseWorker] = None
         self._fullscreen_window: Optional[FullscreenPlotWindow] = None
+        self._applied_stylesheet: Optional[str] = None
 
         # Get theme manager
         self._theme_manager = get_theme_manager()
@@ -176,7 +177,7 @@ class MainWindow(QMainWindow):
         self.setMinimumSize(1200, 800)
 
         # Apply theme from ThemeManager
-        self.setStyleSheet(self._theme_manager.get_stylesheet())
+        self._apply_stylesheet()
 
         # Central widget
         central = QWidget()
@@ -764,13 +765,32 @@ class MainWindow(QMainWindow):
     @Slot()
     def _on_theme_changed(self, mode: ThemeMode) -> None:
         """Handle theme change from ThemeManager."""
-        # Apply new stylesheet to main window
-        self.setStyleSheet(self._theme_manager.get_stylesheet())
+        logger.info(f"Theme changed to: {mode.value}")
+
+        # Apply new stylesheet to main window; nothing else to do if unchanged
+        if not self._apply_stylesheet():
+            return
 
         # Apply theme to all widgets
         self._apply_theme_to_widgets()
 
-        logger.info(f"Theme changed to: {mode.value}")
+    def _apply_stylesheet(self) -> bool:
+        """
+        Apply the current theme stylesheet to the main window.
+
+        Setting a stylesheet re-polishes the whole widget tree, so this
+        is skipped when the stylesheet has not changed.
+
+        Returns:
+            True if the stylesheet was (re)applied
+        """
+        stylesheet = self._theme_manager.get_stylesheet()
+        if stylesheet == self._applied_stylesheet:
+            return False
+
+        self.setStyleSheet(stylesheet)
+        self._applied_stylesheet = stylesheet
+        return True
 
     def _apply_theme_to_widgets(self) -> None:
         """Apply current theme to all widgets."""
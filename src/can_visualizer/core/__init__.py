@@ -5,6 +5,8 @@ from .parser import CANParser
 from .decoder import DBCDecoder
 from .cache import CacheManager
 from .data_store import DataStore
+from .signal_buffer import SignalBuffer
+from .downsample import m4_downsample
 from .theme_manager import ThemeManager, ThemeMode, get_theme_manager
 
 __all__ = [
@@ -15,6 +17,8 @@ __all__ = [
     "DBCDecoder",
     "CacheManager",
     "DataStore",
+    "SignalBuffer",
+    "m4_downsample",
     "ThemeManager",
     "ThemeMode",
     "get_theme_manager",
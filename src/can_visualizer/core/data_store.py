@@ -1,4 +1,6 @@
 import sqlite3
+import sys
+from array import array
 from typing import Iterator, Optional, List
 from .models import DecodedSignal
 from contextlib import contextmanager
@@ -90,12 +92,15 @@ class DataStore:
 
         return len(batch)
 
-    def fetch_data(self, limit: Optional[int] = None) -> Iterator[DecodedSignal]:
+    def fetch_data(
+        self, limit: Optional[int] = None, offset: int = 0
+    ) -> Iterator[DecodedSignal]:
         """
         Fetch data from the store.
 
         Args:
             limit: precise number of records to return.
+            offset: number of leading records to skip.
 
         Yields:
             DecodedSignal objects.
@@ -103,9 +108,10 @@ class DataStore:
         query = "SELECT * FROM signals ORDER BY timestamp"
         params = ()
 
-        if limit is not None:
-            query += " LIMIT ?"
-            params = (limit,)
+        if limit is not None or offset:
+            # SQLite needs a LIMIT clause for OFFSET; -1 means no limit
+            query += " LIMIT ? OFFSET ?"
+            params = (-1 if limit is None else limit, offset)
 
         with self._get_connection() as conn:
             cursor = conn.execute(query, params)
@@ -159,10 +165,11 @@ class DataStore:
         signal_name: str,
         min_timestamp: Optional[float] = None,
         message_name: Optional[str] = None,
-    ) -> tuple[List[float], List[float]]:
+    ) -> tuple[array, array]:
         """
         Fetch timestamps and physical values for a signal.
-        Optimized for plotting.
+        Optimized for plotting: results are typed float arrays that
+        NumPy can wrap without copying (np.frombuffer).
 
         Args:
             signal_name: Name of signal to fetch.
@@ -171,7 +178,7 @@ class DataStore:
                          signals with the same name from different messages.
 
         Returns:
-            Tuple of (timestamps, values) lists.
+            Tuple of (timestamps, values) as array('d').
         """
         query = "SELECT timestamp, physical_value FROM signals WHERE signal_name = ?"
         params: list = [signal_name]
@@ -186,14 +193,14 @@ class DataStore:
 
         query += " ORDER BY timestamp"
 
-        timestamps = []
-        values = []
+        timestamps = array("d")
+        values = array("d")
 
         with self._get_connection() as conn:
             cursor = conn.execute(query, params)
             for row in cursor:
-                timestamps.append(row["timestamp"])
-                values.append(row["physical_value"])
+                timestamps.append(row[0])
+                values.append(row[1])
 
         return timestamps, values
 
@@ -221,14 +228,16 @@ class DataStore:
 
     def _row_to_signal(self, row: sqlite3.Row) -> DecodedSignal:
         """Convert a database row to a DecodedSignal object."""
+        # SQLite returns a fresh str per row; interning lets every loaded
+        # signal share the few distinct message/signal/unit names
         return DecodedSignal(
             timestamp=row["timestamp"],
-            message_name=row["message_name"],
+            message_name=sys.intern(row["message_name"]),
             message_id=row["message_id"],
-            signal_name=row["signal_name"],
+            signal_name=sys.intern(row["signal_name"]),
             raw_value=int(row["raw_value"]),
             physical_value=row["physical_value"],
-            unit=row["unit"],
+            unit=sys.intern(row["unit"] or ""),
         )
 
     def clear(self) -> None:
@@ -0,0 +1,116 @@
+"""
+Peak-preserving downsampling for plotted signals.
+
+Implements M4 bucketing: the samples are split into equal buckets and
+each bucket is reduced to its first, minimum, maximum and last sample.
+Unlike stride decimation this keeps short spikes visible while still
+bounding the number of points sent to the renderer.
+
+When numba is installed the per-bucket min/max scan runs as a compiled
+loop (one pass over the data instead of separate argmin and argmax
+passes); otherwise the vectorized NumPy path is used. The kernel is
+compiled on first use, so call warm_up() off the GUI thread at startup
+to keep that cost out of the first plot redraw. It is deliberately
+serial: each bucket scan is short and memory-bound, and numba's default
+threading layer aborts on concurrent parallel launches from two threads.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is an optional accelerator
+    njit = None
+
+
+def _bucket_extrema_numpy(
+    y: np.ndarray, bucket: int, full: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Column offsets of the min and max sample in each full bucket."""
+    yv = y[: full * bucket].reshape(full, bucket)
+    return yv.argmin(axis=1), yv.argmax(axis=1)
+
+
+if njit is not None:
+
+    @njit(cache=True, nogil=True)
+    def _bucket_extrema(y, bucket, full):  # pragma: no cover - compiled
+        imin = np.empty(full, dtype=np.intp)
+        imax = np.empty(full, dtype=np.intp)
+        for b in range(full):
+            start = b * bucket
+            lo = 0
+            hi = 0
+            vmin = y[start]
+            vmax = vmin
+            for i in range(1, bucket):
+                v = y[start + i]
+                if v < vmin:
+                    vmin = v
+                    lo = i
+                elif v > vmax:
+                    vmax = v
+                    hi = i
+            imin[b] = lo
+            imax[b] = hi
+        return imin, imax
+
+else:
+    _bucket_extrema = _bucket_extrema_numpy
+
+
+def warm_up() -> None:
+    """
+    Compile the numba kernel, or load it from numba's on-disk cache.
+
+    Safe to run on a background thread; a plot that needs the kernel
+    before this finishes waits for the compile instead of starting its own.
+    Does nothing when numba is not installed.
+    """
+    if njit is not None:
+        _bucket_extrema(np.zeros(8), 4, 2)
+
+
+def m4_downsample(
+    x: np.ndarray, y: np.ndarray, max_points: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce (x, y) to at most about `max_points` samples.
+
+    Args:
+        x: Sample x coordinates (timestamps), ascending
+        y: Sample values, same length as x
+        max_points: Output budget; four points are emitted per bucket
+
+    Returns:
+        Tuple of (x, y) arrays. The inputs are returned unchanged when
+        they already fit the budget.
+    """
+    n = len(x)
+    bucket_count = max(1, max_points // 4)
+    if n <= max_points or n <= 4:
+        return x, y
+
+    bucket = -(-n // bucket_count)  # ceil division
+    full = n // bucket
+    n_full = full * bucket
+
+    # Per-bucket column offsets of first/min/max/last, kept in index order
+    # so the polyline stays monotonic in x.
+    imin, imax = _bucket_extrema(np.ascontiguousarray(y), bucket, full)
+    columns = np.empty((full, 4), dtype=np.intp)
+    columns[:, 0] = 0
+    columns[:, 1] = np.minimum(imin, imax)
+    columns[:, 2] = np.maximum(imin, imax)
+    columns[:, 3] = bucket - 1
+    indices = (columns + (np.arange(full) * bucket)[:, None]).ravel()
+
+    # Trailing partial bucket
+    if n_full < n:
+        tail = y[n_full:]
+        tmin = n_full + int(tail.argmin())
+        tmax = n_full + int(tail.argmax())
+        tail_indices = [n_full, min(tmin, tmax), max(tmin, tmax), n - 1]
+        indices = np.concatenate((indices, tail_indices))
+
+    return x[indices], y[indices]
@@ -0,0 +1,159 @@
+"""
+Growable NumPy sample buffer for plotted signals.
+
+Stores (timestamp, value) samples for one signal in preallocated
+float64 arrays so streaming appends avoid Python list growth and
+plots can read the live data as zero-copy array views.
+"""
+
+from array import array
+from bisect import bisect_left
+from collections.abc import Sequence
+
+import numpy as np
+
+ArrayLike = Sequence[float] | array | np.ndarray
+
+
+def _as_float_array(data: ArrayLike, count: int) -> np.ndarray:
+    """View or convert `data` as a float64 ndarray of length `count`."""
+    if isinstance(data, np.ndarray):
+        return data
+    # array('d') exposes its buffer directly; no per-element unboxing
+    if isinstance(data, array) and data.typecode == "d":
+        return np.frombuffer(data, dtype=np.float64, count=count)
+    # Other Python sequences go through one typed fromiter copy
+    return np.fromiter(data, dtype=np.float64, count=count)
+
+
+class SignalBuffer:
+    """
+    Append-only (timestamp, value) storage for a single signal.
+
+    Design decisions:
+    - Two parallel float64 arrays with a shared write index
+    - Capacity doubles when full (amortized O(1) appends)
+    - timestamps/values return views of the filled region, not copies
+    """
+
+    __slots__ = (
+        "_size",
+        "_timestamps",
+        "_timestamps_view",
+        "_values",
+        "_values_view",
+    )
+
+    INITIAL_CAPACITY = 4096
+
+    def __init__(self, capacity: int = INITIAL_CAPACITY):
+        capacity = max(1, capacity)
+        self._timestamps = np.empty(capacity, dtype=np.float64)
+        self._values = np.empty(capacity, dtype=np.float64)
+        self._size = 0
+        # memoryview indexing yields Python floats, which keeps bisect and
+        # tooltip formatting cheap compared to NumPy scalars
+        self._timestamps_view = memoryview(self._timestamps)
+        self._values_view = memoryview(self._values)
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        """Number of samples that fit before the next reallocation."""
+        return len(self._timestamps)
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """View of the stored timestamps."""
+        return self._timestamps[: self._size]
+
+    @property
+    def values(self) -> np.ndarray:
+        """View of the stored values."""
+        return self._values[: self._size]
+
+    def append(self, timestamp: float, value: float) -> None:
+        """Append a single sample."""
+        if self._size == len(self._timestamps):
+            self._reserve(self._size + 1)
+        self._timestamps[self._size] = timestamp
+        self._values[self._size] = value
+        self._size += 1
+
+    def extend(self, timestamps: ArrayLike, values: ArrayLike) -> None:
+        """
+        Append a batch of samples.
+
+        Args:
+            timestamps: Sample timestamps (list, array('d') or ndarray)
+            values: Sample values, same length as timestamps
+        """
+        count = len(timestamps)
+        if count == 0:
+            return
+
+        end = self._size + count
+        if end > len(self._timestamps):
+            self._reserve(end)
+
+        timestamps = _as_float_array(timestamps, count)
+        values = _as_float_array(values, count)
+
+        self._timestamps[self._size : end] = timestamps
+        self._values[self._size : end] = values
+        self._size = end
+
+    def nearest_index(self, timestamp: float) -> int:
+        """
+        Find the sample closest in time to `timestamp`.
+
+        Timestamps are assumed ascending. Must not be called on an
+        empty buffer.
+        """
+        times = self._timestamps_view
+        size = self._size
+        idx = bisect_left(times, timestamp, 0, size)
+
+        if idx == 0:
+            return 0
+        if idx >= size:
+            return size - 1
+        if abs(times[idx] - timestamp) < abs(times[idx - 1] - timestamp):
+            return idx
+        return idx - 1
+
+    def nearest_sample(self, timestamp: float) -> tuple[float, float]:
+        """
+        Return the (timestamp, value) sample closest in time to `timestamp`.
+
+        Both are plain Python floats. Must not be called on an empty buffer.
+        """
+        idx = self.nearest_index(timestamp)
+        return self._timestamps_view[idx], self._values_view[idx]
+
+    def copy(self) -> "SignalBuffer":
+        """Return an independent buffer holding the same samples."""
+        other = SignalBuffer(self._size)
+        other.extend(self.timestamps, self.values)
+        return other
+
+    def clear(self) -> None:
+        """Drop all samples, keeping the allocated capacity."""
+        self._size = 0
+
+    def _reserve(self, needed: int) -> None:
+        """Grow the backing arrays to hold at least `needed` samples."""
+        capacity = len(self._timestamps)
+        while capacity < needed:
+            capacity *= 2
+
+        timestamps = np.empty(capacity, dtype=np.float64)
+        values = np.empty(capacity, dtype=np.float64)
+        timestamps[: self._size] = self._timestamps[: self._size]
+        values[: self._size] = self._values[: self._size]
+        self._timestamps = timestamps
+        self._values = values
+        self._timestamps_view = memoryview(timestamps)
+        self._values_view = memoryview(values)
@@ -5,6 +5,7 @@ Provides centralized theme management with System/Dark/Light modes,
 persistent preferences, and notifications for theme changes.
 """
 
+import re
 from enum import Enum
 from typing import Optional
 
@@ -13,6 +14,516 @@ from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QPalette, QGuiApplication
 
 
+def _minify_qss(qss: str) -> str:
+    """
+    Collapse whitespace in a Qt stylesheet.
+
+    Qt tokenizes the whole string on every setStyleSheet call, so the
+    readable sources below are minified once at import time.
+    """
+    qss = re.sub(r"\s+", " ", qss)
+    return re.sub(r"\s*([{};:,])\s*", r"\1", qss).strip()
+
+
+_DARK_STYLESHEET_SOURCE = """
+QMainWindow {
+    background: #1E1E1E;
+}
+QWidget {
+    background: #1E1E1E;
+    color: #D4D4D4;
+    font-family: 'Segoe UI', 'SF Pro Display', -apple-system, sans-serif;
+    font-size: 13px;
+}
+QGroupBox {
+    border: 1px solid #3D3D3D;
+    border-radius: 4px;
+    margin-top: 8px;
+    padding-top: 8px;
+    font-weight: bold;
+}
+QGroupBox::title {
+    subcontrol-origin: margin;
+    left: 8px;
+    padding: 0 4px;
+}
+QTabWidget::pane {
+    border: 1px solid #3D3D3D;
+    border-radius: 4px;
+}
+QTabBar::tab {
+    background: #2D2D2D;
+    border: 1px solid #3D3D3D;
+    border-bottom: none;
+    padding: 8px 16px;
+    margin-right: 2px;
+}
+QTabBar::tab:selected {
+    background: #1E1E1E;
+    border-bottom: 2px solid #0078D4;
+}
+QTabBar::tab:hover {
+    background: #3D3D3D;
+}
+QPushButton {
+    background: #0078D4;
+    border: none;
+    border-radius: 4px;
+    padding: 6px 16px;
+    color: white;
+    font-weight: 500;
+}
+QPushButton:hover {
+    background: #1084D9;
+}
+QPushButton:pressed {
+    background: #006CC1;
+}
+QPushButton:disabled {
+    background: #3D3D3D;
+    color: #666;
+}
+QPushButton:checked {
+    background: #005A9E;
+    border: 1px solid #0078D4;
+}
+QLineEdit {
+    background: #2D2D2D;
+    border: 1px solid #3D3D3D;
+    border-radius: 4px;
+    padding: 6px 8px;
+    selection-background-color: #0078D4;
+}
+QLineEdit:focus {
+    border-color: #0078D4;
+}
+QTreeWidget {
+    background: #252526;
+    alternate-background-color: #2D2D2D;
+    border: 1px solid #3D3D3D;
+    border-radius: 4px;
+}
+QTreeWidget::item {
+    padding: 4px;
+}
+QTreeWidget::item:hover {
+    background: #2D2D2D;
+}
+QTreeWidget::item:selected {
+    background: #0078D4;
+}
+QTableView {
+    background: #1E1E1E;
+    alternate-background-color: #252526;
+    border: 1px solid #3D3D3D;
+    gridline-color: transparent;
+}
+QTableView::item {
+    padding: 4px 8px;
+    border: none;
+}
+QTableView::item:selected {
+    background: #094771;
+    color: #FFFFFF;
+}
+QTableView::item:hover {
+    background: #2D2D2D;
+}
+QHeaderView::section {
+    background: #2D2D2D;
+    color: #E0E0E0;
+    border: none;
+    border-right: 1px solid #3D3D3D;
+    border-bottom: 1px solid #3D3D3D;
+    padding: 6px;
+    font-weight: bold;
+}
+QProgressBar {
+    background: #2D2D2D;
+    border: none;
+    border-radius: 4px;
+    text-align: center;
+}
+QProgressBar::chunk {
+    background: #0078D4;
+    border-radius: 4px;
+}
+QStatusBar {
+    background: #252526;
+    border-top: 1px solid #3D3D3D;
+}
+QMenuBar {
+    background: #252526;
+    border-bottom: 1px solid #3D3D3D;
+}
+QMenuBar::item {
+    padding: 6px 12px;
+}
+QMenuBar::item:selected {
+    background: #3D3D3D;
+}
+QMenu {
+    background: #2D2D2D;
+    border: 1px solid #3D3D3D;
+}
+QMenu::item {
+    padding: 6px 24px;
+}
+QMenu::item:selected {
+    background: #0078D4;
+}
+QMenu::separator {
+    height: 1px;
+    background: #3D3D3D;
+    margin: 4px 8px;
+}
+QToolBar {
+    background: #252526;
+    border-bottom: 1px solid #3D3D3D;
+    spacing: 4px;
+    padding: 4px;
+}
+QSplitter::handle {
+    background: #3D3D3D;
+}
+QComboBox {
+    background: #2D2D2D;
+    border: 1px solid #3D3D3D;
+    border-radius: 4px;
+    padding: 6px 8px;
+}
+QComboBox:hover {
+    border-color: #0078D4;
+}
+QComboBox::drop-down {
+    border: none;
+    width: 20px;
+}
+QComboBox QAbstractItemView {
+    background: #2D2D2D;
+    border: 1px solid #3D3D3D;
+    selection-background-color: #0078D4;
+}
+QCheckBox {
+    spacing: 8px;
+}
+QCheckBox::indicator {
+    width: 16px;
+    height: 16px;
+    border-radius: 3px;
+    border: 1px solid #3D3D3D;
+    background: #2D2D2D;
+}
+QCheckBox::indicator:checked {
+    background: #0078D4;
+    border-color: #0078D4;
+}
+QScrollBar:vertical {
+    background: #1E1E1E;
+    width: 12px;
+    margin: 0;
+}
+QScrollBar::handle:vertical {
+    background: #3D3D3D;
+    border-radius: 6px;
+    min-height: 20px;
+}
+QScrollBar::handle:vertical:hover {
+    background: #4D4D4D;
+}
+QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+    height: 0;
+}
+QScrollBar:horizontal {
+    background: #1E1E1E;
+    height: 12px;
+    margin: 0;
+}
+QScrollBar::handle:horizontal {
+    background: #3D3D3D;
+    border-radius: 6px;
+    min-width: 20px;
+}
+QScrollBar::handle:horizontal:hover {
+    background: #4D4D4D;
+}
+QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
+    width: 0;
+}
+QListWidget {
+    background: #1E1E1E;
+    alternate-background-color: #252526;
+    border: 1px solid #3D3D3D;
+    border-radius: 4px;
+}
+QListWidget::item {
+    padding: 6px;
+    border-bottom: 1px solid #3D3D3D;
+}
+QListWidget::item:hover {
+    background: #2D2D2D;
+}
+QListWidget::item:selected {
+    background: #0078D4;
+}
+QFrame[frameShape="4"], QFrame[frameShape="5"] {
+    background: #3D3D3D;
+}
+"""
+
+_LIGHT_STYLESHEET_SOURCE = """
+QMainWindow {
+    background: #F5F5F5;
+}
+QWidget {
+    background: #F5F5F5;
+    color: #1E1E1E;
+    font-family: 'Segoe UI', 'SF Pro Display', -apple-system, sans-serif;
+    font-size: 13px;
+}
+QGroupBox {
+    border: 1px solid #D0D0D0;
+    border-radius: 4px;
+    margin-top: 8px;
+    padding-top: 8px;
+    font-weight: bold;
+}
+QGroupBox::title {
+    subcontrol-origin: margin;
+    left: 8px;
+    padding: 0 4px;
+}
+QTabWidget::pane {
+    border: 1px solid #D0D0D0;
+    border-radius: 4px;
+}
+QTabBar::tab {
+    background: #E8E8E8;
+    border: 1px solid #D0D0D0;
+    border-bottom: none;
+    padding: 8px 16px;
+    margin-right: 2px;
+}
+QTabBar::tab:selected {
+    background: #F5F5F5;
+    border-bottom: 2px solid #0078D4;
+}
+QTabBar::tab:hover {
+    background: #DFDFDF;
+}
+QPushButton {
+    background: #0078D4;
+    border: none;
+    border-radius: 4px;
+    padding: 6px 16px;
+    color: white;
+    font-weight: 500;
+}
+QPushButton:hover {
+    background: #1084D9;
+}
+QPushButton:pressed {
+    background: #006CC1;
+}
+QPushButton:disabled {
+    background: #D0D0D0;
+    color: #888;
+}
+QPushButton:checked {
+    background: #005A9E;
+    border: 1px solid #0078D4;
+}
+QLineEdit {
+    background: #FFFFFF;
+    border: 1px solid #D0D0D0;
+    border-radius: 4px;
+    padding: 6px 8px;
+    selection-background-color: #0078D4;
+}
+QLineEdit:focus {
+    border-color: #0078D4;
+}
+QTreeWidget {
+    background: #FFFFFF;
+    alternate-background-color: #F8F8F8;
+    border: 1px solid #D0D0D0;
+    border-radius: 4px;
+}
+QTreeWidget::item {
+    padding: 4px;
+}
+QTreeWidget::item:hover {
+    background: #E8E8E8;
+}
+QTreeWidget::item:selected {
+    background: #0078D4;
+    color: white;
+}
+QTableView {
+    background: #FFFFFF;
+    alternate-background-color: #F8F8F8;
+    border: 1px solid #D0D0D0;
+    gridline-color: transparent;
+}
+QTableView::item {
+    padding: 4px 8px;
+    border: none;
+}
+QTableView::item:selected {
+    background: #0078D4;
+    color: #FFFFFF;
+}
+QTableView::item:hover {
+    background: #E8E8E8;
+}
+QHeaderView::section {
+    background: #E8E8E8;
+    color: #1E1E1E;
+    border: none;
+    border-right: 1px solid #D0D0D0;
+    border-bottom: 1px solid #D0D0D0;
+    padding: 6px;
+    font-weight: bold;
+}
+QProgressBar {
+    background: #E8E8E8;
+    border: none;
+    border-radius: 4px;
+    text-align: center;
+}
+QProgressBar::chunk {
+    background: #0078D4;
+    border-radius: 4px;
+}
+QStatusBar {
+    background: #E8E8E8;
+    border-top: 1px solid #D0D0D0;
+}
+QMenuBar {
+    background: #E8E8E8;
+    border-bottom: 1px solid #D0D0D0;
+}
+QMenuBar::item {
+    padding: 6px 12px;
+}
+QMenuBar::item:selected {
+    background: #D0D0D0;
+}
+QMenu {
+    background: #FFFFFF;
+    border: 1px solid #D0D0D0;
+}
+QMenu::item {
+    padding: 6px 24px;
+}
+QMenu::item:selected {
+    background: #0078D4;
+    color: white;
+}
+QMenu::separator {
+    height: 1px;
+    background: #D0D0D0;
+    margin: 4px 8px;
+}
+QToolBar {
+    background: #E8E8E8;
+    border-bottom: 1px solid #D0D0D0;
+    spacing: 4px;
+    padding: 4px;
+}
+QSplitter::handle {
+    background: #D0D0D0;
+}
+QComboBox {
+    background: #FFFFFF;
+    border: 1px solid #D0D0D0;
+    border-radius: 4px;
+    padding: 6px 8px;
+}
+QComboBox:hover {
+    border-color: #0078D4;
+}
+QComboBox::drop-down {
+    border: none;
+    width: 20px;
+}
+QComboBox QAbstractItemView {
+    background: #FFFFFF;
+    border: 1px solid #D0D0D0;
+    selection-background-color: #0078D4;
+}
+QCheckBox {
+    spacing: 8px;
+}
+QCheckBox::indicator {
+    width: 16px;
+    height: 16px;
+    border-radius: 3px;
+    border: 1px solid #D0D0D0;
+    background: #FFFFFF;
+}
+QCheckBox::indicator:checked {
+    background: #0078D4;
+    border-color: #0078D4;
+}
+QScrollBar:vertical {
+    background: #F5F5F5;
+    width: 12px;
+    margin: 0;
+}
+QScrollBar::handle:vertical {
+    background: #C0C0C0;
+    border-radius: 6px;
+    min-height: 20px;
+}
+QScrollBar::handle:vertical:hover {
+    background: #A0A0A0;
+}
+QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+    height: 0;
+}
+QScrollBar:horizontal {
+    background: #F5F5F5;
+    height: 12px;
+    margin: 0;
+}
+QScrollBar::handle:horizontal {
+    background: #C0C0C0;
+    border-radius: 6px;
+    min-width: 20px;
+}
+QScrollBar::handle:horizontal:hover {
+    background: #A0A0A0;
+}
+QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
+    width: 0;
+}
+QListWidget {
+    background: #FFFFFF;
+    alternate-background-color: #F8F8F8;
+    border: 1px solid #D0D0D0;
+    border-radius: 4px;
+}
+QListWidget::item {
+    padding: 6px;
+    border-bottom: 1px solid #E8E8E8;
+}
+QListWidget::item:hover {
+    background: #E8E8E8;
+}
+QListWidget::item:selected {
+    background: #0078D4;
+    color: white;
+}
+QFrame[frameShape="4"], QFrame[frameShape="5"] {
+    background: #D0D0D0;
+}
+"""
+
+_DARK_STYLESHEET = _minify_qss(_DARK_STYLESHEET_SOURCE)
+_LIGHT_STYLESHEET = _minify_qss(_LIGHT_STYLESHEET_SOURCE)
+
+
 class ThemeMode(Enum):
     """Available theme modes."""
 
@@ -21,6 +532,11 @@ class ThemeMode(Enum):
     LIGHT = "light"
 
 
+# QSettings key and accepted values for the persisted theme mode
+_THEME_KEY = "theme/mode"
+_VALID_MODES = frozenset(mode.value for mode in ThemeMode)
+
+
 class ThemeManager(QObject):
     """
     Singleton theme manager for the application.
@@ -31,6 +547,8 @@ class ThemeManager(QObject):
 
     _instance: Optional["ThemeManager"] = None
 
+    _DEFAULT_MODE = ThemeMode.DARK
+
     # Signal emitted when theme changes
     theme_changed = Signal(ThemeMode)
 
@@ -46,20 +564,30 @@ class ThemeManager(QObject):
         self._initialized = True
 
         self._settings = QSettings("CAN Tools", "CAN Message Visualizer")
-        self._current_mode = ThemeMode.DARK  # Default to dark
+        self._current_mode = self._DEFAULT_MODE
         self._load_preference()
 
+        # Style hints are owned by the application; look them up once and
+        # follow OS dark/light switches while in SYSTEM mode.
+        self._style_hints = (
+            QGuiApplication.styleHints() if QGuiApplication.instance() else None
+        )
+        if self._style_hints:
+            self._style_hints.colorSchemeChanged.connect(self._on_system_scheme_changed)
+
+        # Effective dark state last announced via theme_changed
+        self._is_dark = self.is_dark_mode()
+
     def _load_preference(self) -> None:
         """Load saved theme preference."""
-        saved = self._settings.value("theme/mode", "dark")
-        try:
-            self._current_mode = ThemeMode(saved)
-        except ValueError:
-            self._current_mode = ThemeMode.DARK
+        saved = self._settings.value(_THEME_KEY, self._DEFAULT_MODE.value)
+        self._current_mode = (
+            ThemeMode(saved) if saved in _VALID_MODES else self._DEFAULT_MODE
+        )
 
     def _save_preference(self) -> None:
         """Save current theme preference."""
-        self._settings.setValue("theme/mode", self._current_mode.value)
+        self._settings.setValue(_THEME_KEY, self._current_mode.value)
 
     @property
     def current_mode(self) -> ThemeMode:
@@ -79,7 +607,25 @@ class ThemeManager(QObject):
         self._current_mode = mode
         self._save_preference()
         self.apply_color_scheme()
-        self.theme_changed.emit(mode)
+        self._refresh_effective_theme()
+
+    def _refresh_effective_theme(self) -> None:
+        """
+        Emit theme_changed if the effective dark/light state changed.
+
+        Skips the repolish when e.g. switching SYSTEM <-> DARK while the
+        system itself is dark.
+        """
+        is_dark = self.is_dark_mode()
+        if is_dark == self._is_dark:
+            return
+        self._is_dark = is_dark
+        self.theme_changed.emit(self._current_mode)
+
+    def _on_system_scheme_changed(self, scheme: Qt.ColorScheme) -> None:
+        """Handle OS color scheme changes."""
+        if self._current_mode == ThemeMode.SYSTEM:
+            self._refresh_effective_theme()
 
     def apply_color_scheme(self) -> None:
         """
@@ -87,11 +633,7 @@ class ThemeManager(QObject):
 
         On macOS, this sets the appearance for the window chrome.
         """
-        app = QGuiApplication.instance()
-        if not app:
-            return
-
-        style_hints = app.styleHints()
+        style_hints = self._style_hints
         if not style_hints:
             return
 
@@ -114,7 +656,13 @@ class ThemeManager(QObject):
         if self._current_mode == ThemeMode.DARK:
             return True
 
-        # SYSTEM mode - check system preference
+        # SYSTEM mode - Qt reports the platform color scheme directly
+        if self._style_hints:
+            scheme = self._style_hints.colorScheme()
+            if scheme != Qt.ColorScheme.Unknown:
+                return scheme == Qt.ColorScheme.Dark
+
+        # Platform did not report a scheme; fall back to palette lightness
         app = QApplication.instance()
         if app:
             palette = app.palette()
@@ -138,502 +686,11 @@ class ThemeManager(QObject):
 
     def _get_dark_stylesheet(self) -> str:
         """Return dark theme stylesheet."""
-        return """
-            QMainWindow {
-                background: #1E1E1E;
-            }
-            QWidget {
-                background: #1E1E1E;
-                color: #D4D4D4;
-                font-family: 'Segoe UI', 'SF Pro Display', -apple-system, sans-serif;
-                font-size: 13px;
-            }
-            QGroupBox {
-                border: 1px solid #3D3D3D;
-                border-radius: 4px;
-                margin-top: 8px;
-                padding-top: 8px;
-                font-weight: bold;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 8px;
-                padding: 0 4px;
-            }
-            QTabWidget::pane {
-                border: 1px solid #3D3D3D;
-                border-radius: 4px;
-            }
-            QTabBar::tab {
-                background: #2D2D2D;
-                border: 1px solid #3D3D3D;
-                border-bottom: none;
-                padding: 8px 16px;
-                margin-right: 2px;
-            }
-            QTabBar::tab:selected {
-                background: #1E1E1E;
-                border-bottom: 2px solid #0078D4;
-            }
-            QTabBar::tab:hover {
-                background: #3D3D3D;
-            }
-            QPushButton {
-                background: #0078D4;
-                border: none;
-                border-radius: 4px;
-                padding: 6px 16px;
-                color: white;
-                font-weight: 500;
-            }
-            QPushButton:hover {
-                background: #1084D9;
-            }
-            QPushButton:pressed {
-                background: #006CC1;
-            }
-            QPushButton:disabled {
-                background: #3D3D3D;
-                color: #666;
-            }
-            QPushButton:checked {
-                background: #005A9E;
-                border: 1px solid #0078D4;
-            }
-            QLineEdit {
-                background: #2D2D2D;
-                border: 1px solid #3D3D3D;
-                border-radius: 4px;
-                padding: 6px 8px;
-                selection-background-color: #0078D4;
-            }
-            QLineEdit:focus {
-                border-color: #0078D4;
-            }
-            QTreeWidget {
-                background: #252526;
-                alternate-background-color: #2D2D2D;
-                border: 1px solid #3D3D3D;
-                border-radius: 4px;
-            }
-            QTreeWidget::item {
-                padding: 4px;
-            }
-            QTreeWidget::item:hover {
-                background: #2D2D2D;
-            }
-            QTreeWidget::item:selected {
-                background: #0078D4;
-            }
-            QTableView {
-                background: #1E1E1E;
-                alternate-background-color: #252526;
-                border: 1px solid #3D3D3D;
-                gridline-color: transparent;
-            }
-            QTableView::item {
-                padding: 4px 8px;
-                border: none;
-            }
-            QTableView::item:selected {
-                background: #094771;
-                color: #FFFFFF;
-            }
-            QTableView::item:hover {
-                background: #2D2D2D;
-            }
-            QHeaderView::section {
-                background: #2D2D2D;
-                color: #E0E0E0;
-                border: none;
-                border-right: 1px solid #3D3D3D;
-                border-bottom: 1px solid #3D3D3D;
-                padding: 6px;
-                font-weight: bold;
-            }
-            QProgressBar {
-                background: #2D2D2D;
-                border: none;
-                border-radius: 4px;
-                text-align: center;
-            }
-            QProgressBar::chunk {
-                background: #0078D4;
-                border-radius: 4px;
-            }
-            QStatusBar {
-                background: #252526;
-                border-top: 1px solid #3D3D3D;
-            }
-            QMenuBar {
-                background: #252526;
-                border-bottom: 1px solid #3D3D3D;
-            }
-            QMenuBar::item {
-                padding: 6px 12px;
-            }
-            QMenuBar::item:selected {
-                background: #3D3D3D;
-            }
-            QMenu {
-                background: #2D2D2D;
-                border: 1px solid #3D3D3D;
-            }
-            QMenu::item {
-                padding: 6px 24px;
-            }
-            QMenu::item:selected {
-                background: #0078D4;
-            }
-            QMenu::separator {
-                height: 1px;
-                background: #3D3D3D;
-                margin: 4px 8px;
-            }
-            QToolBar {
-                background: #252526;
-                border-bottom: 1px solid #3D3D3D;
-                spacing: 4px;
-                padding: 4px;
-            }
-            QSplitter::handle {
-                background: #3D3D3D;
-            }
-            QComboBox {
-                background: #2D2D2D;
-                border: 1px solid #3D3D3D;
-                border-radius: 4px;
-                padding: 6px 8px;
-            }
-            QComboBox:hover {
-                border-color: #0078D4;
-            }
-            QComboBox::drop-down {
-                border: none;
-                width: 20px;
-            }
-            QComboBox QAbstractItemView {
-                background: #2D2D2D;
-                border: 1px solid #3D3D3D;
-                selection-background-color: #0078D4;
-            }
-            QCheckBox {
-                spacing: 8px;
-            }
-            QCheckBox::indicator {
-                width: 16px;
-                height: 16px;
-                border-radius: 3px;
-                border: 1px solid #3D3D3D;
-                background: #2D2D2D;
-            }
-            QCheckBox::indicator:checked {
-                background: #0078D4;
-                border-color: #0078D4;
-            }
-            QScrollBar:vertical {
-                background: #1E1E1E;
-                width: 12px;
-                margin: 0;
-            }
-            QScrollBar::handle:vertical {
-                background: #3D3D3D;
-                border-radius: 6px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: #4D4D4D;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0;
-            }
-            QScrollBar:horizontal {
-                background: #1E1E1E;
-                height: 12px;
-                margin: 0;
-            }
-            QScrollBar::handle:horizontal {
-                background: #3D3D3D;
-                border-radius: 6px;
-                min-width: 20px;
-            }
-            QScrollBar::handle:horizontal:hover {
-                background: #4D4D4D;
-            }
-            QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
-                width: 0;
-            }
-            QListWidget {
-                background: #1E1E1E;
-                alternate-background-color: #252526;
-                border: 1px solid #3D3D3D;
-                border-radius: 4px;
-            }
-            QListWidget::item {
-                padding: 6px;
-                border-bottom: 1px solid #3D3D3D;
-            }
-            QListWidget::item:hover {
-                background: #2D2D2D;
-            }
-            QListWidget::item:selected {
-                background: #0078D4;
-            }
-            QFrame[frameShape="4"], QFrame[frameShape="5"] {
-                background: #3D3D3D;
-            }
-        """
+        return _DARK_STYLESHEET
 
     def _get_light_stylesheet(self) -> str:
         """Return light theme stylesheet."""
-        return """
-            QMainWindow {
-                background: #F5F5F5;
-            }
-            QWidget {
-                background: #F5F5F5;
-                color: #1E1E1E;
-                font-family: 'Segoe UI', 'SF Pro Display', -apple-system, sans-serif;
-                font-size: 13px;
-            }
-            QGroupBox {
-                border: 1px solid #D0D0D0;
-                border-radius: 4px;
-                margin-top: 8px;
-                padding-top: 8px;
-                font-weight: bold;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 8px;
-                padding: 0 4px;
-            }
-            QTabWidget::pane {
-                border: 1px solid #D0D0D0;
-                border-radius: 4px;
-            }
-            QTabBar::tab {
-                background: #E8E8E8;
-                border: 1px solid #D0D0D0;
-                border-bottom: none;
-                padding: 8px 16px;
-                margin-right: 2px;
-            }
-            QTabBar::tab:selected {
-                background: #F5F5F5;
-                border-bottom: 2px solid #0078D4;
-            }
-            QTabBar::tab:hover {
-                background: #DFDFDF;
-            }
-            QPushButton {
-                background: #0078D4;
-                border: none;
-                border-radius: 4px;
-                padding: 6px 16px;
-                color: white;
-                font-weight: 500;
-            }
-            QPushButton:hover {
-                background: #1084D9;
-            }
-            QPushButton:pressed {
-                background: #006CC1;
-            }
-            QPushButton:disabled {
-                background: #D0D0D0;
-                color: #888;
-            }
-            QPushButton:checked {
-                background: #005A9E;
-                border: 1px solid #0078D4;
-            }
-            QLineEdit {
-                background: #FFFFFF;
-                border: 1px solid #D0D0D0;
-                border-radius: 4px;
-                padding: 6px 8px;
-                selection-background-color: #0078D4;
-            }
-            QLineEdit:focus {
-                border-color: #0078D4;
-            }
-            QTreeWidget {
-                background: #FFFFFF;
-                alternate-background-color: #F8F8F8;
-                border: 1px solid #D0D0D0;
-                border-radius: 4px;
-            }
-            QTreeWidget::item {
-                padding: 4px;
-            }
-            QTreeWidget::item:hover {
-                background: #E8E8E8;
-            }
-            QTreeWidget::item:selected {
-                background: #0078D4;
-                color: white;
-            }
-            QTableView {
-                background: #FFFFFF;
-                alternate-background-color: #F8F8F8;
-                border: 1px solid #D0D0D0;
-                gridline-color: transparent;
-            }
-            QTableView::item {
-                padding: 4px 8px;
-                border: none;
-            }
-            QTableView::item:selected {
-                background: #0078D4;
-                color: #FFFFFF;
-            }
-            QTableView::item:hover {
-                background: #E8E8E8;
-            }
-            QHeaderView::section {
-                background: #E8E8E8;
-                color: #1E1E1E;
-                border: none;
-                border-right: 1px solid #D0D0D0;
-                border-bottom: 1px solid #D0D0D0;
-                padding: 6px;
-                font-weight: bold;
-            }
-            QProgressBar {
-                background: #E8E8E8;
-                border: none;
-                border-radius: 4px;
-                text-align: center;
-            }
-            QProgressBar::chunk {
-                background: #0078D4;
-                border-radius: 4px;
-            }
-            QStatusBar {
-                background: #E8E8E8;
-                border-top: 1px solid #D0D0D0;
-            }
-            QMenuBar {
-                background: #E8E8E8;
-                border-bottom: 1px solid #D0D0D0;
-            }
-            QMenuBar::item {
-                padding: 6px 12px;
-            }
-            QMenuBar::item:selected {
-                background: #D0D0D0;
-            }
-            QMenu {
-                background: #FFFFFF;
-                border: 1px solid #D0D0D0;
-            }
-            QMenu::item {
-                padding: 6px 24px;
-            }
-            QMenu::item:selected {
-                background: #0078D4;
-                color: white;
-            }
-            QMenu::separator {
-                height: 1px;
-                background: #D0D0D0;
-                margin: 4px 8px;
-            }
-            QToolBar {
-                background: #E8E8E8;
-                border-bottom: 1px solid #D0D0D0;
-                spacing: 4px;
-                padding: 4px;
-            }
-            QSplitter::handle {
-                background: #D0D0D0;
-            }
-            QComboBox {
-                background: #FFFFFF;
-                border: 1px solid #D0D0D0;
-                border-radius: 4px;
-                padding: 6px 8px;
-            }
-            QComboBox:hover {
-                border-color: #0078D4;
-            }
-            QComboBox::drop-down {
-                border: none;
-                width: 20px;
-            }
-            QComboBox QAbstractItemView {
-                background: #FFFFFF;
-                border: 1px solid #D0D0D0;
-                selection-background-color: #0078D4;
-            }
-            QCheckBox {
-                spacing: 8px;
-            }
-            QCheckBox::indicator {
-                width: 16px;
-                height: 16px;
-                border-radius: 3px;
-                border: 1px solid #D0D0D0;
-                background: #FFFFFF;
-            }
-            QCheckBox::indicator:checked {
-                background: #0078D4;
-                border-color: #0078D4;
-            }
-            QScrollBar:vertical {
-                background: #F5F5F5;
-                width: 12px;
-                margin: 0;
-            }
-            QScrollBar::handle:vertical {
-                background: #C0C0C0;
-                border-radius: 6px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: #A0A0A0;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0;
-            }
-            QScrollBar:horizontal {
-                background: #F5F5F5;
-                height: 12px;
-                margin: 0;
-            }
-            QScrollBar::handle:horizontal {
-                background: #C0C0C0;
-                border-radius: 6px;
-                min-width: 20px;
-            }
-            QScrollBar::handle:horizontal:hover {
-                background: #A0A0A0;
-            }
-            QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
-                width: 0;
-            }
-            QListWidget {
-                background: #FFFFFF;
-                alternate-background-color: #F8F8F8;
-                border: 1px solid #D0D0D0;
-                border-radius: 4px;
-            }
-            QListWidget::item {
-                padding: 6px;
-                border-bottom: 1px solid #E8E8E8;
-            }
-            QListWidget::item:hover {
-                background: #E8E8E8;
-            }
-            QListWidget::item:selected {
-                background: #0078D4;
-                color: white;
-            }
-            QFrame[frameShape="4"], QFrame[frameShape="5"] {
-                background: #D0D0D0;
-            }
-        """
+        return _LIGHT_STYLESHEET
 
 
 # Global instance accessor
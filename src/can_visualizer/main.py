@@ -6,14 +6,16 @@ and visualizing CAN logs from BLF and ASC files using DBC databases.
 """
 
 import sys
+import threading
 from pathlib import Path
 
 from PySide6.QtWidgets import QApplication
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QSettings
 from PySide6.QtGui import QFont
 
-from .utils.logging_config import setup_logging
+from .utils.logging_config import setup_logging, shutdown_logging
 from .app import MainWindow
+from .core.downsample import warm_up
 
 
 def main() -> int:
@@ -32,19 +34,30 @@ def main() -> int:
         Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
     )
 
+    # JIT-compile the optional numba downsampler while the UI starts, so
+    # the first plot redraw does not stall on it
+    threading.Thread(target=warm_up, name="jit-warm-up", daemon=True).start()
+
     # Create application
     app = QApplication(sys.argv)
     app.setApplicationName("CAN Message Visualizer")
     app.setApplicationVersion("1.0.0")
     app.setOrganizationName("CAN Tools")
 
-    # Set default font
-    font = QFont("Segoe UI", 10)
-    if not font.exactMatch():
-        font = QFont("SF Pro Display", 10)
-    if not font.exactMatch():
-        font = QFont()
-        font.setPointSize(10)
+    # Set default font. The family chosen on first launch is remembered so
+    # later launches skip the exactMatch() font-database probes.
+    settings = QSettings()
+    family = settings.value("ui/font_family", "")
+    if family:
+        font = QFont(family, 10)
+    else:
+        font = QFont("Segoe UI", 10)
+        if not font.exactMatch():
+            font = QFont("SF Pro Display", 10)
+        if not font.exactMatch():
+            font = QFont()
+            font.setPointSize(10)
+        settings.setValue("ui/font_family", font.family())
     app.setFont(font)
 
     # Create and show main window
@@ -57,6 +70,9 @@ def main() -> int:
     exit_code = app.exec()
 
     logger.info(f"Application exiting with code {exit_code}")
+
+    # Drain the log queue before the interpreter shuts down
+    shutdown_logging()
     return exit_code
 
 
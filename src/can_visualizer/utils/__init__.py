@@ -1,5 +1,5 @@
 """Utility modules."""
 
-from .logging_config import setup_logging
+from .logging_config import setup_logging, shutdown_logging
 
-__all__ = ["setup_logging"]
+__all__ = ["setup_logging", "shutdown_logging"]
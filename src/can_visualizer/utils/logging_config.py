@@ -6,14 +6,21 @@ Provides structured logging for:
 - Decode failures
 - Cache operations
 - Performance metrics
+
+Records are handed to a QueueListener thread so file writes and
+rotation never block the Qt main thread.
 """
 
 import logging
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from typing import Optional
 
+# Background listener draining the log queue to the real handlers
+_listener: Optional[QueueListener] = None
+
 
 def setup_logging(
     log_dir: Optional[Path] = None,
@@ -25,6 +32,10 @@ def setup_logging(
     """
     Configure application logging with rotating file handler.
 
+    The file and console handlers run on a background QueueListener;
+    the logger itself only enqueues records. Call shutdown_logging()
+    before exit to flush pending records.
+
     Args:
         log_dir: Directory for log files. Defaults to ~/.can_visualizer/logs
         console_level: Logging level for console output
@@ -40,6 +51,9 @@ def setup_logging(
 
     log_dir.mkdir(parents=True, exist_ok=True)
 
+    # Stop a listener left over from a previous setup
+    shutdown_logging()
+
     # Create custom logger for our application
     logger = logging.getLogger("can_visualizer")
     logger.setLevel(logging.DEBUG)
@@ -65,13 +79,21 @@ def setup_logging(
     )
     file_handler.setLevel(file_level)
     file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
 
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(console_level)
     console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
+
+    # Only the queue handler is attached to the logger; the listener
+    # thread performs the actual I/O.
+    global _listener
+    log_queue: queue.Queue = queue.Queue(-1)
+    _listener = QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    _listener.start()
+    logger.addHandler(QueueHandler(log_queue))
 
     # Log startup
     logger.info("=" * 60)
@@ -82,6 +104,17 @@ def setup_logging(
     return logger
 
 
+def shutdown_logging() -> None:
+    """Flush queued log records and stop the background listener."""
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
+
+
 def get_logger(name: str) -> logging.Logger:
     """Get a child logger with the given name."""
     return logging.getLogger(f"can_visualizer.{name}")
@@ -5,9 +5,9 @@ Provides a detachable, fullscreen-capable plot window that
 mirrors the main plot with synchronized signal selection.
 """
 
+from collections import defaultdict
 from typing import Optional
-import numpy as np
-from PySide6.QtCore import Qt, Signal, Slot
+from PySide6.QtCore import Qt, Signal, Slot, QTimer, QEvent
 from PySide6.QtWidgets import (
     QMainWindow,
     QWidget,
@@ -21,10 +21,71 @@ from PySide6.QtGui import QKeySequence, QShortcut, QFont
 import pyqtgraph as pg
 
 from ..core.models import DecodedSignal
+from ..core.signal_buffer import SignalBuffer
 from ..utils.logging_config import get_logger
+from .plot_curves import PlotCurves
 
 logger = get_logger("fullscreen_plot")
 
+# Window stylesheets, built once and reused on theme changes
+_DARK_STYLESHEET = """
+QMainWindow {
+    background: #1E1E1E;
+}
+QWidget {
+    background: #1E1E1E;
+    color: #E0E0E0;
+}
+QPushButton {
+    background: #3D3D3D;
+    border: 1px solid #555;
+    border-radius: 4px;
+    padding: 6px 12px;
+    color: #E0E0E0;
+}
+QPushButton:hover {
+    background: #4D4D4D;
+}
+QPushButton:pressed {
+    background: #2D2D2D;
+}
+QCheckBox {
+    color: #E0E0E0;
+}
+QLabel {
+    color: #888;
+}
+"""
+
+_LIGHT_STYLESHEET = """
+QMainWindow {
+    background: #F5F5F5;
+}
+QWidget {
+    background: #F5F5F5;
+    color: #1E1E1E;
+}
+QPushButton {
+    background: #E8E8E8;
+    border: 1px solid #D0D0D0;
+    border-radius: 4px;
+    padding: 6px 12px;
+    color: #1E1E1E;
+}
+QPushButton:hover {
+    background: #D8D8D8;
+}
+QPushButton:pressed {
+    background: #C8C8C8;
+}
+QCheckBox {
+    color: #1E1E1E;
+}
+QLabel {
+    color: #666;
+}
+"""
+
 
 class FullscreenPlotWindow(QMainWindow):
     """
@@ -56,14 +117,12 @@ class FullscreenPlotWindow(QMainWindow):
     ]
 
     MAX_POINTS = 100_000
+    REPAINT_INTERVAL = 16  # ms, caps repaints at ~60 Hz
 
     def __init__(self, parent=None):
         super().__init__(parent)
 
-        self._signal_data: dict[str, tuple[list[float], list[float]]] = {}
-        self._plot_items: dict[str, pg.PlotDataItem] = {}
-        self._selected_signals: list[str] = []
-        self._custom_colors: dict[str, str] = {}  # signal_name -> hex color
+        self._signal_data: dict[str, SignalBuffer] = {}
 
         # Crosshair and tooltip components
         self._vline: Optional[pg.InfiniteLine] = None
@@ -71,7 +130,19 @@ class FullscreenPlotWindow(QMainWindow):
         self._tooltip: Optional[pg.TextItem] = None
         self._crosshair_enabled = True
 
+        # Coalesces data/selection changes into one repaint per frame
+        self._repaint_timer = QTimer(self)
+        self._repaint_timer.setSingleShot(True)
+        self._repaint_timer.setInterval(self.REPAINT_INTERVAL)
+        self._repaint_timer.timeout.connect(self._update_plot)
+        # Set when a repaint was skipped while hidden or minimized
+        self._repaint_pending = False
+
         self._setup_ui()
+        # Plot items, pens and downsample cache for the selected signals
+        self._curves = PlotCurves(
+            self._plot_widget, self._legend, self.COLORS, self.MAX_POINTS
+        )
         self._setup_shortcuts()
         self._setup_crosshair()
 
@@ -80,35 +151,8 @@ class FullscreenPlotWindow(QMainWindow):
         self.setWindowTitle("CAN Signal Plot - Fullscreen")
         self.setMinimumSize(800, 600)
 
-        # Dark theme
-        self.setStyleSheet("""
-            QMainWindow {
-                background: #1E1E1E;
-            }
-            QWidget {
-                background: #1E1E1E;
-                color: #E0E0E0;
-            }
-            QPushButton {
-                background: #3D3D3D;
-                border: 1px solid #555;
-                border-radius: 4px;
-                padding: 6px 12px;
-                color: #E0E0E0;
-            }
-            QPushButton:hover {
-                background: #4D4D4D;
-            }
-            QPushButton:pressed {
-                background: #2D2D2D;
-            }
-            QCheckBox {
-                color: #E0E0E0;
-            }
-            QLabel {
-                color: #888;
-            }
-        """)
+        self._applied_stylesheet = _DARK_STYLESHEET
+        self.setStyleSheet(_DARK_STYLESHEET)
 
         # Central widget
         central = QWidget()
@@ -178,7 +222,8 @@ class FullscreenPlotWindow(QMainWindow):
         self._legend.setParentItem(self._plot_widget.graphicsItem())
 
         self._plot_widget.setClipToView(True)
-        self._plot_widget.setDownsampling(auto=True, mode="peak")
+        # Data is already M4-downsampled; pyqtgraph's own pass would redo it
+        self._plot_widget.setDownsampling(ds=1, auto=False)
 
         layout.addWidget(self._plot_widget)
 
@@ -211,26 +256,31 @@ class FullscreenPlotWindow(QMainWindow):
 
     def set_selected_signals(self, signal_names: list[str]) -> None:
         """Update displayed signals."""
-        self._selected_signals = signal_names
-        self._update_plot()
+        self._curves.set_selected(signal_names)
+        self._request_plot_update()
 
         self._signal_label.setText(f"{len(signal_names)} signals selected")
 
     @Slot(list)
     def add_signals(self, signals: list[DecodedSignal]) -> None:
         """Add new signal data during streaming."""
+        # Group by signal in one pass, then store each group in bulk
+        grouped: defaultdict[str, tuple[list[float], list[float]]] = defaultdict(
+            lambda: ([], [])
+        )
         for signal in signals:
-            full_name = signal.full_name
-
-            if full_name not in self._signal_data:
-                self._signal_data[full_name] = ([], [])
-
-            timestamps, values = self._signal_data[full_name]
+            timestamps, values = grouped[signal.full_name]
             timestamps.append(signal.timestamp)
             values.append(signal.physical_value)
 
-        if any(sig.full_name in self._selected_signals for sig in signals):
-            self._update_plot()
+        for full_name, (timestamps, values) in grouped.items():
+            buf = self._signal_data.get(full_name)
+            if buf is None:
+                buf = self._signal_data[full_name] = SignalBuffer()
+            buf.extend(timestamps, values)
+
+        if not grouped.keys().isdisjoint(self._curves.selected):
+            self._request_plot_update()
 
     def load_signal_data(
         self, data: dict[str, tuple[list[float], list[float]]]
@@ -238,72 +288,53 @@ class FullscreenPlotWindow(QMainWindow):
         """Load pre-computed signal data."""
         for name, (timestamps, values) in data.items():
             if name not in self._signal_data:
-                self._signal_data[name] = ([], [])
+                # Size new buffers for the whole batch up front
+                self._signal_data[name] = SignalBuffer(
+                    max(len(timestamps), SignalBuffer.INITIAL_CAPACITY)
+                )
 
-            self._signal_data[name][0].extend(timestamps)
-            self._signal_data[name][1].extend(values)
+            self._signal_data[name].extend(timestamps, values)
 
-        self._update_plot()
+        self._request_plot_update()
+
+    def _request_plot_update(self) -> None:
+        """Schedule a repaint, merging requests made within one frame."""
+        if not self.isVisible() or self.isMinimized():
+            self._repaint_pending = True
+            return
+        if not self._repaint_timer.isActive():
+            self._repaint_timer.start()
 
     def _update_plot(self) -> None:
         """Refresh plot display."""
-        # Remove unselected
-        for name in list(self._plot_items.keys()):
-            if name not in self._selected_signals:
-                item = self._plot_items.pop(name)
-                self._plot_widget.removeItem(item)
-
-        total_points = 0
-
-        for i, name in enumerate(self._selected_signals):
-            if name not in self._signal_data:
-                continue
-
-            timestamps, values = self._signal_data[name]
-            if not timestamps:
-                continue
-
-            x = np.array(timestamps)
-            y = np.array(values)
-
-            if len(x) > self.MAX_POINTS:
-                factor = len(x) // self.MAX_POINTS
-                x = x[::factor]
-                y = y[::factor]
-
-            total_points += len(x)
-            color = self._custom_colors.get(name) or self.COLORS[i % len(self.COLORS)]
-
-            if name in self._plot_items:
-                self._plot_items[name].setData(x, y)
-                self._plot_items[name].setPen(pg.mkPen(color=color, width=1.5))
-            else:
-                pen = pg.mkPen(color=color, width=1.5)
-                item = self._plot_widget.plot(
-                    x,
-                    y,
-                    pen=pen,
-                    name=name.split(".")[-1],
-                )
-                self._plot_items[name] = item
+        # Nothing on screen to refresh; catch up when the window reappears
+        if not self.isVisible() or self.isMinimized():
+            self._repaint_pending = True
+            return
+        self._repaint_pending = False
 
+        total_points = self._curves.update(self._signal_data)
         self._point_label.setText(f"{total_points:,} points")
 
     def clear(self) -> None:
         """Clear all data."""
-        for item in self._plot_items.values():
-            self._plot_widget.removeItem(item)
-
-        self._plot_items.clear()
+        self._curves.clear()
         self._signal_data.clear()
         self._point_label.setText("0 points")
 
-    def sync_data(self, data: dict[str, tuple[list[float], list[float]]]) -> None:
-        """Sync data from main plot."""
-        self._signal_data = {
-            name: (list(ts), list(vs)) for name, (ts, vs) in data.items()
-        }
-        self._update_plot()
+    def sync_data(self, data: dict[str, SignalBuffer]) -> None:
+        """
+        Sync data from main plot.
+
+        Each buffer copy is a single memcpy of its filled region; the
+        repaint is deferred to the frame timer, so nothing is drawn while
+        the buffers are being replaced.
+        """
+        self._signal_data = {name: buf.copy() for name, buf in data.items()}
+        # Cached downsamples reference the previous buffers; drop them now
+        # rather than keeping the old copies alive until the next repaint
+        self._curves.drop_cached_arrays()
+        self._request_plot_update()
 
     def set_signal_color(self, signal_name: str, color: str) -> None:
         """
@@ -313,11 +344,8 @@ class FullscreenPlotWindow(QMainWindow):
             signal_name: Full signal name (Message.Signal)
             color: Hex color string, or empty string to reset to default
         """
-        if color:
-            self._custom_colors[signal_name] = color
-        elif signal_name in self._custom_colors:
-            del self._custom_colors[signal_name]
-        self._update_plot()
+        self._curves.set_color(signal_name, color)
+        self._request_plot_update()
 
     def _on_grid_toggled(self, checked: bool) -> None:
         """Toggle grid."""
@@ -343,6 +371,22 @@ class FullscreenPlotWindow(QMainWindow):
             self.showFullScreen()
             self._fullscreen_btn.setText("⛶ Exit Fullscreen")
 
+    def showEvent(self, event) -> None:
+        """Apply repaints skipped while the window was hidden."""
+        super().showEvent(event)
+        if self._repaint_pending:
+            self._request_plot_update()
+
+    def changeEvent(self, event) -> None:
+        """Apply repaints skipped while the window was minimized."""
+        super().changeEvent(event)
+        if (
+            event.type() == QEvent.Type.WindowStateChange
+            and self._repaint_pending
+            and not self.isMinimized()
+        ):
+            self._request_plot_update()
+
     def closeEvent(self, event) -> None:
         """Handle window close."""
         self.closed.emit()
@@ -389,7 +433,6 @@ class FullscreenPlotWindow(QMainWindow):
             rateLimit=60,
             slot=self._on_mouse_moved,
         )
-        self._plot_widget.scene().sigMouseMoved.connect(self._check_mouse_in_plot)
 
     def _on_mouse_moved(self, evt) -> None:
         """Handle mouse movement for crosshair and tooltip updates."""
@@ -416,32 +459,13 @@ class FullscreenPlotWindow(QMainWindow):
         # Find closest data points
         tooltip_lines = [f"Time: {x_pos:.6f} s"]
 
-        for name in self._selected_signals:
-            if name not in self._signal_data:
+        signal_data = self._signal_data
+        for name, signal_name in self._curves.short_names.items():
+            buf = signal_data.get(name)
+            if buf is None or not len(buf):
                 continue
 
-            timestamps, values = self._signal_data[name]
-            if not timestamps:
-                continue
-
-            x_arr = np.array(timestamps)
-            y_arr = np.array(values)
-
-            idx = np.searchsorted(x_arr, x_pos)
-
-            if idx == 0:
-                closest_idx = 0
-            elif idx >= len(x_arr):
-                closest_idx = len(x_arr) - 1
-            else:
-                if abs(x_arr[idx] - x_pos) < abs(x_arr[idx - 1] - x_pos):
-                    closest_idx = idx
-                else:
-                    closest_idx = idx - 1
-
-            signal_name = name.split(".")[-1]
-            value = y_arr[closest_idx]
-            timestamp = x_arr[closest_idx]
+            timestamp, value = buf.nearest_sample(x_pos)
 
             dt = timestamp - x_pos
             if abs(dt) < 0.001:
@@ -470,12 +494,6 @@ class FullscreenPlotWindow(QMainWindow):
         else:
             self._tooltip.hide()
 
-    def _check_mouse_in_plot(self, pos) -> None:
-        """Hide crosshair when mouse leaves plot area."""
-        plot_item = self._plot_widget.getPlotItem()
-        if not plot_item.sceneBoundingRect().contains(pos):
-            self._hide_crosshair()
-
     def _hide_crosshair(self) -> None:
         """Hide crosshair and tooltip."""
         if self._vline:
@@ -501,65 +519,11 @@ class FullscreenPlotWindow(QMainWindow):
         """
         is_dark = bg_color.startswith("#1") or bg_color.startswith("#2")
 
-        # Update window stylesheet
-        if is_dark:
-            self.setStyleSheet("""
-                QMainWindow {
-                    background: #1E1E1E;
-                }
-                QWidget {
-                    background: #1E1E1E;
-                    color: #E0E0E0;
-                }
-                QPushButton {
-                    background: #3D3D3D;
-                    border: 1px solid #555;
-                    border-radius: 4px;
-                    padding: 6px 12px;
-                    color: #E0E0E0;
-                }
-                QPushButton:hover {
-                    background: #4D4D4D;
-                }
-                QPushButton:pressed {
-                    background: #2D2D2D;
-                }
-                QCheckBox {
-                    color: #E0E0E0;
-                }
-                QLabel {
-                    color: #888;
-                }
-            """)
-        else:
-            self.setStyleSheet("""
-                QMainWindow {
-                    background: #F5F5F5;
-                }
-                QWidget {
-                    background: #F5F5F5;
-                    color: #1E1E1E;
-                }
-                QPushButton {
-                    background: #E8E8E8;
-                    border: 1px solid #D0D0D0;
-                    border-radius: 4px;
-                    padding: 6px 12px;
-                    color: #1E1E1E;
-                }
-                QPushButton:hover {
-                    background: #D8D8D8;
-                }
-                QPushButton:pressed {
-                    background: #C8C8C8;
-                }
-                QCheckBox {
-                    color: #1E1E1E;
-                }
-                QLabel {
-                    color: #666;
-                }
-            """)
+        # Only re-polish the widget tree when the stylesheet actually changes
+        stylesheet = _DARK_STYLESHEET if is_dark else _LIGHT_STYLESHEET
+        if stylesheet is not self._applied_stylesheet:
+            self._applied_stylesheet = stylesheet
+            self.setStyleSheet(stylesheet)
 
         self._plot_widget.setBackground(bg_color)
 
@@ -8,7 +8,10 @@ Designed to handle millions of rows efficiently using:
 - Virtual scrolling (Qt only requests visible rows)
 """
 
+from array import array
+from bisect import bisect_left
 from typing import Optional
+import numpy as np
 from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, Signal, Slot, QTimer
 from PySide6.QtWidgets import (
     QWidget,
@@ -40,6 +43,8 @@ class SignalTableModel(QAbstractTableModel):
     Architecture:
     - _signals: Loaded subset for display (paginated, 1000 at a time)
     - User scrolls to bottom -> load_more() fetches next page from DataStore
+    - No canFetchMore()/fetchMore(): the widget drives paging, and the view
+      would otherwise load its own pages on top of the widget's
 
     This reduces UI memory pressure by only keeping loaded pages in the
     Qt model while maintaining full data in the backing SQLite store.
@@ -55,6 +60,44 @@ class SignalTableModel(QAbstractTableModel):
         ("Unit", "unit"),
     ]
 
+    # Message color palette and alignments, built once for all data() calls
+    _MESSAGE_COLORS = tuple(
+        QColor(c)
+        for c in (
+            "#2E86AB",
+            "#A23B72",
+            "#F18F01",
+            "#C73E1D",
+            "#3A506B",
+            "#5BC0BE",
+            "#6B2D5C",
+            "#F0A202",
+            "#0D3B66",
+            "#7B2D26",
+            "#2D6A4F",
+            "#9B5DE5",
+        )
+    )
+    _ALIGN_RIGHT = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+    _ALIGN_LEFT = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+    # Per-column alignment: numbers right-aligned, names left-aligned
+    _COLUMN_ALIGNMENT = (
+        _ALIGN_RIGHT,  # Timestamp
+        _ALIGN_LEFT,  # Message
+        _ALIGN_RIGHT,  # ID
+        _ALIGN_LEFT,  # Signal
+        _ALIGN_RIGHT,  # Raw
+        _ALIGN_RIGHT,  # Physical
+        _ALIGN_LEFT,  # Unit
+    )
+    _HANDLED_ROLES = frozenset(
+        (
+            Qt.ItemDataRole.DisplayRole,
+            Qt.ItemDataRole.TextAlignmentRole,
+            Qt.ItemDataRole.ForegroundRole,
+        )
+    )
+
     # Pagination settings
     PAGE_SIZE = 1000  # Signals per page for infinite scroll
 
@@ -68,22 +111,28 @@ class SignalTableModel(QAbstractTableModel):
 
         # Loaded signals - paginated subset for display
         self._signals: list[DecodedSignal] = []
-
-        # Pagination state
-        self._current_page = 0
+        # Display text per column, formatted once when a page is loaded
+        self._display_columns: tuple[list[str], ...] = tuple([] for _ in self.COLUMNS)
+        # Filter keys: each distinct full name gets a small integer code
+        # holding (full name, message lower, signal lower); rows store codes
+        self._name_codes: dict[str, int] = {}
+        self._name_keys: list[tuple[str, str, str]] = []
+        # Message color per name code, resolved when the code is assigned
+        self._name_colors: list[QColor] = []
+        self._row_codes = array("i")
 
         # Filtering
         self._filter_text: str = ""
-        self._signal_filter: set[str] = set()
-        self._filtered_indices: Optional[list[int]] = None
+        self._signal_filter: frozenset[str] = frozenset()
+        # Loaded-row index of each visible row while a filter is active;
+        # a C int array is ~7x smaller than a list of Python ints
+        self._filtered_indices: Optional[array] = None
 
     def set_data_store(self, data_store: DataStore) -> None:
         """Set the data store source."""
         self.beginResetModel()
         self._data_store = data_store
-        self._signals.clear()
-        self._current_page = 0
-        self._filtered_indices = None
+        self._clear_loaded()
         self.endResetModel()
 
     def rowCount(self, parent=QModelIndex()) -> int:
@@ -97,9 +146,16 @@ class SignalTableModel(QAbstractTableModel):
         return len(self.COLUMNS)
 
     def data(self, index: QModelIndex, role: int):
-        if not index.isValid():
+        # Views query many roles per cell; answer the unused ones immediately
+        if role not in self._HANDLED_ROLES or not index.isValid():
             return None
 
+        col = index.column()
+
+        # Alignment depends only on the column; no row lookup needed
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return self._COLUMN_ALIGNMENT[col]
+
         # Get actual row index (handle filtering)
         if self._filtered_indices is not None:
             if index.row() >= len(self._filtered_indices):
@@ -111,50 +167,11 @@ class SignalTableModel(QAbstractTableModel):
         if actual_row >= len(self._signals):
             return None
 
-        signal = self._signals[actual_row]
-        col = index.column()
-
         if role == Qt.ItemDataRole.DisplayRole:
-            if col == 0:  # Timestamp
-                return f"{signal.timestamp:.6f}"
-            elif col == 1:  # Message
-                return signal.message_name
-            elif col == 2:  # ID
-                return f"0x{signal.message_id:03X}"
-            elif col == 3:  # Signal
-                return signal.signal_name
-            elif col == 4:  # Raw
-                return str(signal.raw_value)
-            elif col == 5:  # Physical
-                return f"{signal.physical_value:.4g}"
-            elif col == 6:  # Unit
-                return signal.unit
-
-        elif role == Qt.ItemDataRole.TextAlignmentRole:
-            if col in (0, 2, 4, 5):  # Numeric columns
-                return Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
-            return Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
-
-        elif role == Qt.ItemDataRole.ForegroundRole:
-            # Color code by message for easier reading
-            msg_hash = hash(signal.message_name) % 12
-            colors = [
-                QColor("#2E86AB"),
-                QColor("#A23B72"),
-                QColor("#F18F01"),
-                QColor("#C73E1D"),
-                QColor("#3A506B"),
-                QColor("#5BC0BE"),
-                QColor("#6B2D5C"),
-                QColor("#F0A202"),
-                QColor("#0D3B66"),
-                QColor("#7B2D26"),
-                QColor("#2D6A4F"),
-                QColor("#9B5DE5"),
-            ]
-            return colors[msg_hash]
-
-        return None
+            return self._display_columns[col][actual_row]
+
+        # ForegroundRole: color code by message for easier reading
+        return self._name_colors[self._row_codes[actual_row]]
 
     def headerData(self, section: int, orientation: Qt.Orientation, role: int):
         if role != Qt.ItemDataRole.DisplayRole:
@@ -172,38 +189,95 @@ class SignalTableModel(QAbstractTableModel):
         Returns:
             Number of signals loaded in this page
         """
+        return self._load_rows(self.PAGE_SIZE)
+
+    def _load_rows(self, limit: Optional[int]) -> int:
+        """
+        Fetch up to `limit` rows following the loaded ones and insert them.
+
+        A limit of None loads everything that is left in one insert.
+        """
         if not self._data_store:
             return 0
 
-        next_page = self._current_page + 1
+        # Continue from the loaded row count rather than a page number so a
+        # short last page is topped up once more data reaches the store
         new_signals = list(
-            self._data_store.fetch_paginated_data(next_page, self.PAGE_SIZE)
+            self._data_store.fetch_data(limit, offset=len(self._signals))
         )
 
         if not new_signals:
             return 0
 
         first_row = len(self._signals)
-        last_row = first_row + len(new_signals) - 1
-
-        self.beginInsertRows(QModelIndex(), first_row, last_row)
-        self._signals.extend(new_signals)
-        self._current_page = next_page
+        self._extend_display_columns(new_signals)
+        self._extend_filter_keys(new_signals)
 
-        # Update filter if active
-        if self._filter_text or self._signal_filter:
-            self._apply_filter()
+        if self._filtered_indices is None:
+            self.beginInsertRows(
+                QModelIndex(), first_row, first_row + len(new_signals) - 1
+            )
+            self._signals.extend(new_signals)
+            self.endInsertRows()
+        else:
+            # Filter only the new page and insert just the rows that pass;
+            # the view's rows are filtered rows, not loaded signals
+            self._signals.extend(new_signals)
+            new_indices = self._filter_rows(first_row)
+            if new_indices:
+                first = len(self._filtered_indices)
+                self.beginInsertRows(QModelIndex(), first, first + len(new_indices) - 1)
+                self._filtered_indices.extend(new_indices)
+                self.endInsertRows()
+
+        logger.debug(f"Loaded {len(new_signals)} signals ({len(self._signals)} total)")
+        return len(new_signals)
 
-        self.endInsertRows()
+    def _clear_loaded(self) -> None:
+        """Drop loaded signals and everything derived from them."""
+        self._signals.clear()
+        for column in self._display_columns:
+            column.clear()
+        self._name_codes.clear()
+        self._name_keys.clear()
+        self._name_colors.clear()
+        del self._row_codes[:]
+        self._filtered_indices = None
 
-        logger.debug(f"Loaded page {self._current_page}: {len(new_signals)} signals")
-        return len(new_signals)
+    def _extend_filter_keys(self, signals: list[DecodedSignal]) -> None:
+        """Record the name code of each newly loaded signal."""
+        name_codes = self._name_codes
+        name_keys = self._name_keys
+        colors = self._MESSAGE_COLORS
+        codes = []
+        for sig in signals:
+            full_name = sig.full_name
+            code = name_codes.get(full_name)
+            if code is None:
+                code = name_codes[full_name] = len(name_keys)
+                name_keys.append(
+                    (full_name, sig.message_name.lower(), sig.signal_name.lower())
+                )
+                self._name_colors.append(colors[hash(sig.message_name) % len(colors)])
+            codes.append(code)
+        self._row_codes.extend(codes)
+
+    def _extend_display_columns(self, signals: list[DecodedSignal]) -> None:
+        """Format display text for newly loaded signals, one column at a time."""
+        timestamps, messages, ids, names, raws, physicals, units = self._display_columns
+        timestamps.extend([f"{s.timestamp:.6f}" for s in signals])
+        messages.extend([s.message_name for s in signals])
+        ids.extend([f"0x{s.message_id:03X}" for s in signals])
+        names.extend([s.signal_name for s in signals])
+        raws.extend([str(s.raw_value) for s in signals])
+        physicals.extend([f"{s.physical_value:.4g}" for s in signals])
+        units.extend([s.unit for s in signals])
 
     def load_all(self) -> None:
         """Load all remaining signals."""
-        while self.has_more():
-            if self.load_more() == 0:
-                break
+        # One query and one insert, so the view lays out and repaints once
+        # instead of once per page
+        self._load_rows(None)
 
     def has_more(self) -> bool:
         """Check if there are more signals to load."""
@@ -214,51 +288,93 @@ class SignalTableModel(QAbstractTableModel):
     def clear(self) -> None:
         """Clear loaded signals."""
         self.beginResetModel()
-        self._signals.clear()
-        self._current_page = 0
-        self._filtered_indices = None
+        self._clear_loaded()
         self.endResetModel()
 
     def set_filter(self, text: str) -> None:
         """Set filter text for signal/message names."""
-        self.beginResetModel()
-        self._filter_text = text.lower().strip()
-        self._apply_filter()
-        self.endResetModel()
+        filter_text = text.lower().strip()
+        if filter_text == self._filter_text:
+            return
+
+        self._filter_text = filter_text
+        self._refilter()
 
     def set_signal_filter(self, signal_names: list[str]) -> None:
         """Set filter by specific signal full names."""
-        self.beginResetModel()
-        self._signal_filter = set(signal_names)
+        signal_filter = frozenset(signal_names)
+        if signal_filter == self._signal_filter:
+            return
+
+        self._signal_filter = signal_filter
+        self._refilter()
+
+    def _refilter(self) -> None:
+        """
+        Re-apply the filters as a layout change rather than a model reset.
+
+        Persistent indices (the view's selection and current row) follow
+        their signal to its new row, or become invalid if it was hidden.
+        """
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        loaded_rows = [self._loaded_row(index.row()) for index in persistent]
+
         self._apply_filter()
-        self.endResetModel()
+
+        self.changePersistentIndexList(
+            persistent,
+            [
+                self._view_index(row, index.column())
+                for row, index in zip(loaded_rows, persistent)
+            ],
+        )
+        self.layoutChanged.emit()
+
+    def _loaded_row(self, row: int) -> int:
+        """Map a view row to its index in the loaded signals."""
+        if self._filtered_indices is not None:
+            return self._filtered_indices[row]
+        return row
+
+    def _view_index(self, loaded_row: int, column: int) -> QModelIndex:
+        """Index of a loaded signal in the view, invalid if filtered out."""
+        indices = self._filtered_indices
+        if indices is None:
+            return self.index(loaded_row, column)
+        row = bisect_left(indices, loaded_row)
+        if row < len(indices) and indices[row] == loaded_row:
+            return self.index(row, column)
+        return QModelIndex()
 
     def _apply_filter(self) -> None:
         """Apply current filters to loaded signals."""
-        has_text_filter = bool(self._filter_text)
-        has_signal_filter = bool(self._signal_filter)
-
-        if not has_text_filter and not has_signal_filter:
+        if not self._filter_text and not self._signal_filter:
             self._filtered_indices = None
             return
 
-        indices = []
-        for i, sig in enumerate(self._signals):
-            if has_signal_filter:
-                full_name = f"{sig.message_name}.{sig.signal_name}"
-                if full_name not in self._signal_filter:
-                    continue
-
-            if has_text_filter:
-                if not (
-                    self._filter_text in sig.message_name.lower()
-                    or self._filter_text in sig.signal_name.lower()
-                ):
-                    continue
-
-            indices.append(i)
-
-        self._filtered_indices = indices
+        self._filtered_indices = self._filter_rows(0)
+
+    def _filter_rows(self, start: int) -> array:
+        """Indices of loaded signals from `start` onward that pass the filters."""
+        # Evaluate the predicates once per distinct name, then select rows
+        # with a vectorized lookup over the per-row name codes
+        text = self._filter_text
+        signal_filter = self._signal_filter
+        accepted = np.fromiter(
+            (
+                (not signal_filter or full_name in signal_filter)
+                and (not text or text in message_name or text in signal_name)
+                for full_name, message_name, signal_name in self._name_keys
+            ),
+            dtype=bool,
+            count=len(self._name_keys),
+        )
+        codes = np.frombuffer(self._row_codes, dtype=np.intc)[start:]
+        rows = np.flatnonzero(accepted[codes]).astype(np.intc) + start
+        indices = array("i")
+        indices.frombytes(rows.tobytes())
+        return indices
 
     def get_signal(self, row: int) -> Optional[DecodedSignal]:
         """Get signal at given row (accounting for filter)."""
@@ -291,6 +407,11 @@ class SignalTableModel(QAbstractTableModel):
             return len(self._filtered_indices)
         return len(self._signals)
 
+    @property
+    def has_text_filter(self) -> bool:
+        """Check if a text filter is active."""
+        return bool(self._filter_text)
+
     @property
     def has_signal_filter(self) -> bool:
         """Check if signal filter is active."""
@@ -311,6 +432,8 @@ class MessageLogFilterPanel(QFrame):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._filter_signals: list[str] = []
+        # List entries by full signal name, so updates only touch the delta
+        self._list_items: dict[str, QListWidgetItem] = {}
         self._setup_ui()
 
     def _setup_ui(self):
@@ -389,15 +512,28 @@ class MessageLogFilterPanel(QFrame):
         return list(self._filter_signals)
 
     def _update_list(self):
-        """Update the filters list widget."""
-        self._filters_list.clear()
-
-        for full_name in self._filter_signals:
-            short_name = full_name.split(".")[-1]
-            item = QListWidgetItem(f"● {short_name}")
-            item.setData(Qt.ItemDataRole.UserRole, full_name)
-            item.setToolTip(full_name)
-            self._filters_list.addItem(item)
+        """Update the filters list widget, adding and removing only changes."""
+        wanted = set(self._filter_signals)
+        for full_name in [n for n in self._list_items if n not in wanted]:
+            item = self._list_items.pop(full_name)
+            self._filters_list.takeItem(self._filters_list.row(item))
+
+        # Keep the list in _filter_signals order: rows before `row` are
+        # already in place, so each entry is inserted or moved to `row`
+        for row, full_name in enumerate(self._filter_signals):
+            item = self._list_items.get(full_name)
+            if item is None:
+                short_name = full_name.split(".")[-1]
+                item = QListWidgetItem(f"● {short_name}")
+                item.setData(Qt.ItemDataRole.UserRole, full_name)
+                item.setToolTip(full_name)
+                self._list_items[full_name] = item
+            else:
+                current = self._filters_list.row(item)
+                if current == row:
+                    continue
+                self._filters_list.takeItem(current)
+            self._filters_list.insertItem(row, item)
 
         if self._filter_signals:
             self._status_label.setText(
@@ -448,6 +584,8 @@ class LogTableWidget(QWidget):
     # Configuration
     SCROLL_LOAD_THRESHOLD = 50  # Pixels from bottom to trigger load more
     UPDATE_TIMER_INTERVAL = 500  # ms check for updates
+    FILTER_DEBOUNCE_INTERVAL = 250  # ms of typing pause before filtering
+    SCROLL_CHECK_INTERVAL = 50  # ms between near-bottom checks while scrolling
 
     def __init__(self, data_store: DataStore, parent=None):
         super().__init__(parent)
@@ -455,6 +593,14 @@ class LogTableWidget(QWidget):
         self._model = SignalTableModel(self)
         self._auto_scroll = False
         self._is_loading_more = False
+        # Set while the view is scrolled to the tail in code, so that scroll
+        # does not count as the user reaching the bottom and load a page
+        self._in_programmatic_scroll = False
+        # Cleared when the user scrolls away from the bottom, set again when
+        # they return; auto-scroll only follows the tail while it is set
+        self._following_tail = True
+        # Counts behind the current status text; skips identical redraws
+        self._last_status: Optional[tuple] = None
 
         self._setup_ui()
         self._connect_model_signals()
@@ -507,6 +653,14 @@ class LogTableWidget(QWidget):
         self._filter_input.textChanged.connect(self._on_filter_changed)
         toolbar.addWidget(self._filter_input, stretch=1)
 
+        # Refilter once typing pauses rather than on every keystroke
+        self._filter_debounce = QTimer(self)
+        self._filter_debounce.setSingleShot(True)
+        self._filter_debounce.setInterval(self.FILTER_DEBOUNCE_INTERVAL)
+        self._filter_debounce.timeout.connect(self._apply_text_filter)
+        # Return applies the filter right away without waiting
+        self._filter_input.returnPressed.connect(self._apply_text_filter)
+
         # Load all button (for loading remaining pages)
         self._load_all_btn = QPushButton("⏬ Load All")
         self._load_all_btn.setToolTip("Load all remaining signals into view")
@@ -517,7 +671,7 @@ class LogTableWidget(QWidget):
         # Auto-scroll toggle
         self._auto_scroll_btn = QPushButton("📜 Auto-scroll")
         self._auto_scroll_btn.setCheckable(True)
-        self._auto_scroll_btn.setChecked(True)
+        self._auto_scroll_btn.setChecked(self._auto_scroll)
         self._auto_scroll_btn.clicked.connect(self._on_auto_scroll_toggled)
         toolbar.addWidget(self._auto_scroll_btn)
 
@@ -579,13 +733,24 @@ class LogTableWidget(QWidget):
             5, QHeaderView.ResizeMode.ResizeToContents
         )  # Physical
         header.setSectionResizeMode(6, QHeaderView.ResizeMode.ResizeToContents)  # Unit
+        # Size those columns from the visible rows only; the default samples
+        # up to 1000 rows on every insert, which doubled page load time
+        header.setResizeContentsPrecision(0)
 
         # Optimize for performance
         self._table.setVerticalScrollMode(QTableView.ScrollMode.ScrollPerPixel)
         self._table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
         self._table.verticalHeader().setDefaultSectionSize(22)
-
-        # Connect scroll events for infinite scroll
+        # Rows are one line high; skip the delegate's word-wrap text layout
+        self._table.setWordWrap(False)
+        self._table.setTextElideMode(Qt.TextElideMode.ElideRight)
+
+        # Connect scroll events for infinite scroll; the near-bottom check
+        # (a COUNT query) runs at most once per interval while scrolling
+        self._scroll_check = QTimer(self)
+        self._scroll_check.setSingleShot(True)
+        self._scroll_check.setInterval(self.SCROLL_CHECK_INTERVAL)
+        self._scroll_check.timeout.connect(self._check_scroll_position)
         scrollbar = self._table.verticalScrollBar()
         if scrollbar:
             scrollbar.valueChanged.connect(self._on_scroll)
@@ -623,29 +788,50 @@ class LogTableWidget(QWidget):
         """Periodic check for new data to update auto-scroll or totals."""
         self._update_status()
 
-        # If auto-scroll is on and we are at the bottom, try to load more
+        # If auto-scroll is on, load the next page and follow the tail
         if self._auto_scroll:
             logger.info("Auto-scroll check")
             if self._model.has_more():
+                rows_before = self._model.rowCount()
+
                 self._load_more_signals()
 
-                # Scroll to bottom
-                scrollbar = self._table.verticalScrollBar()
-                if scrollbar:
-                    scrollbar.setValue(scrollbar.maximum())
+                # Follow the tail only if the user has not scrolled away, and
+                # only scroll when the load actually added visible rows
+                if self._following_tail and self._model.rowCount() > rows_before:
+                    self._scroll_to_tail()
+
+    def _scroll_to_tail(self) -> None:
+        """Scroll to the last loaded row without triggering a page load."""
+        self._in_programmatic_scroll = True
+        try:
+            self._table.scrollToBottom()
+        finally:
+            self._in_programmatic_scroll = False
 
     def _on_scroll(self, value: int) -> None:
         """
         Handle scroll events for infinite scroll pagination.
         """
+        if self._in_programmatic_scroll:
+            return
+
+        # valueChanged fires per pixel; check the latest position once the
+        # interval elapses instead of on every event
+        if not self._scroll_check.isActive():
+            self._scroll_check.start()
+
+    def _check_scroll_position(self) -> None:
+        """Load the next page if the view is scrolled near the bottom."""
         scrollbar = self._table.verticalScrollBar()
         if not scrollbar:
             return
 
         # Check if near bottom
-        pixels_from_bottom = scrollbar.maximum() - value
+        pixels_from_bottom = scrollbar.maximum() - scrollbar.value()
+        self._following_tail = pixels_from_bottom <= self.SCROLL_LOAD_THRESHOLD
 
-        if pixels_from_bottom <= self.SCROLL_LOAD_THRESHOLD:
+        if self._following_tail:
             # Try to load more if available
             if self._model.has_more() and not self._is_loading_more:
                 self._load_more_signals()
@@ -676,13 +862,11 @@ class LogTableWidget(QWidget):
         """Handle Load All button click."""
         self._model.load_all()
         self._update_status()
-        self._update_load_all_button()
 
     def clear(self) -> None:
         """Clear all signals."""
         self._model.clear()
         self._update_status()
-        self._update_load_all_button()
 
     def set_signal_filter(self, signal_names: list[str]) -> None:
         """Set filter by specific signal full names (replaces existing)."""
@@ -697,8 +881,13 @@ class LogTableWidget(QWidget):
         return self._filter_panel.get_filter_signals()
 
     def _on_filter_changed(self, text: str) -> None:
-        """Handle filter text changes."""
-        self._model.set_filter(text)
+        """Handle filter text changes (debounced)."""
+        self._filter_debounce.start()
+
+    def _apply_text_filter(self) -> None:
+        """Apply the filter text once typing has paused."""
+        self._filter_debounce.stop()
+        self._model.set_filter(self._filter_input.text())
         self._update_status()
 
     def _on_signal_filter_changed(self, signal_names: list[str]) -> None:
@@ -709,6 +898,8 @@ class LogTableWidget(QWidget):
     def _on_auto_scroll_toggled(self, checked: bool) -> None:
         """Toggle auto-scroll behavior."""
         self._auto_scroll = checked
+        if checked:
+            self._following_tail = True
 
     def _on_clear_clicked(self) -> None:
         """Handle clear button click."""
@@ -725,6 +916,14 @@ class LogTableWidget(QWidget):
         total = self._model.total_count
         loaded = self._model.loaded_count
         filtered = self._model.filtered_count
+        filter_count = self._model.signal_filter_count
+        text_filtered = self._model.has_text_filter
+
+        # Runs every poll tick; only rebuild the label when a count changed
+        status = (total, loaded, filtered, filter_count, text_filtered)
+        if status == self._last_status:
+            return
+        self._last_status = status
 
         # Build status parts
         parts = []
@@ -736,19 +935,19 @@ class LogTableWidget(QWidget):
             parts.append(f"{total:,} signals")
 
         # Filter indicator
-        if self._model.has_signal_filter:
-            filter_count = self._model.signal_filter_count
+        if filter_count:
             parts.append(
                 f"filtering by {filter_count} signal{'s' if filter_count != 1 else ''}"
             )
 
         # Filtered count if different
-        if self._model.has_signal_filter or self._model._filter_text:
+        if filter_count or text_filtered:
             if filtered != loaded:
                 parts[0] = f"{filtered:,} shown ({parts[0]})"
 
         self._status_label.setText(" • ".join(parts))
-        self._update_load_all_button()
+        # Same test as has_more(), without a second COUNT query
+        self._load_all_btn.setVisible(loaded < total)
 
     @property
     def signal_count(self) -> int:
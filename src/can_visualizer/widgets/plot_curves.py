@@ -0,0 +1,168 @@
+"""
+Curve bookkeeping shared by the main and fullscreen plots.
+
+Both plots draw the selected signals from SignalBuffers with the same
+pens, M4 downsampling and change detection. PlotCurves holds that state,
+so each plot only decides when to refresh and what goes in its tooltip.
+"""
+
+import numpy as np
+import pyqtgraph as pg
+from PySide6.QtGui import QPen
+
+from ..core.downsample import m4_downsample
+from ..core.signal_buffer import SignalBuffer
+
+
+class PlotCurves:
+    """
+    Plot items, pens and downsampled arrays for the selected signals.
+
+    Design decisions:
+    - Deselected curves are hidden and emptied rather than removed, so
+      reselecting a signal reuses its PlotDataItem
+    - Downsampled arrays are cached per signal until its buffer grows
+    - setData()/setPen() only run when the array or pen actually changed
+    """
+
+    def __init__(
+        self,
+        plot_widget: pg.PlotWidget,
+        legend: pg.LegendItem,
+        colors: list[str],
+        max_points: int,
+    ):
+        self._plot_widget = plot_widget
+        self._legend = legend
+        self._colors = colors
+        self._max_points = max_points
+
+        self.items: dict[str, pg.PlotDataItem] = {}
+        self.selected: list[str] = []
+        # Legend/tooltip label for each selected signal
+        self.short_names: dict[str, str] = {}
+        self.custom_colors: dict[str, str] = {}  # signal_name -> hex color
+
+        self._pens: dict[str, QPen] = {}
+        # Last (x array, pen) pushed to each plot item
+        self._plotted: dict[str, tuple[np.ndarray, QPen]] = {}
+        # Downsampled, offset-adjusted arrays reused while a buffer is unchanged
+        # Dict[signal_name, (buffer, sample_count, x, y)]
+        self._ds_cache: dict[str, tuple[SignalBuffer, int, np.ndarray, np.ndarray]] = {}
+
+    def set_selected(self, signal_names: list[str]) -> None:
+        """Set the signals to draw and build their labels and pens."""
+        self.selected = signal_names
+        self.short_names = {name: name.split(".")[-1] for name in signal_names}
+        self._pens = {
+            name: pg.mkPen(color=self.signal_color(i, name), width=1.5)
+            for i, name in enumerate(signal_names)
+        }
+
+    def set_color(self, name: str, color: str) -> None:
+        """Set a custom color for a signal, or reset it when color is empty."""
+        if color:
+            self.custom_colors[name] = color
+        elif name in self.custom_colors:
+            del self.custom_colors[name]
+
+        if name in self._pens:
+            index = self.selected.index(name)
+            self._pens[name] = pg.mkPen(color=self.signal_color(index, name), width=1.5)
+
+    def signal_color(self, index: int, name: str) -> str:
+        """Get the custom color of a signal, or its palette color."""
+        return self.custom_colors.get(name) or self._colors[index % len(self._colors)]
+
+    def update(
+        self, signal_data: dict[str, SignalBuffer], time_offset: float | None = None
+    ) -> int:
+        """
+        Bring the plot items in line with the selection and buffers.
+
+        Args:
+            signal_data: Buffer per full signal name
+            time_offset: Subtracted from timestamps to plot elapsed time
+
+        Returns:
+            Number of points plotted across all visible curves
+        """
+        selected = set(self.selected)
+        for name, item in self.items.items():
+            if name not in selected and item.isVisible():
+                # Reselecting pushes fresh data, so release the arrays now
+                item.hide()
+                item.setData([], [])
+                self._legend.removeItem(item)
+                self._ds_cache.pop(name, None)
+                self._plotted.pop(name, None)
+
+        total_points = 0
+
+        for name in self.selected:
+            buf = signal_data.get(name)
+            if buf is None or not len(buf):
+                continue
+
+            x, y = self._plot_arrays(name, buf, time_offset)
+            total_points += len(x)
+
+            pen = self._pens[name]
+
+            item = self.items.get(name)
+            if item is None:
+                item = self._plot_widget.plot(
+                    x,
+                    y,
+                    pen=pen,
+                    name=self.short_names[name],
+                    autoDownsample=False,
+                )
+                self.items[name] = item
+            else:
+                if not item.isVisible():
+                    item.show()
+                    self._legend.addItem(item, self.short_names[name])
+                # Only push what changed; setData re-runs pyqtgraph's
+                # bounds/path work even for identical arrays
+                last_x, last_pen = self._plotted.get(name, (None, None))
+                if x is not last_x:
+                    item.setData(x, y, autoDownsample=False)
+                if pen is not last_pen:
+                    item.setPen(pen)
+            self._plotted[name] = (x, pen)
+
+        return total_points
+
+    def _plot_arrays(
+        self, name: str, buf: SignalBuffer, time_offset: float | None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Get display arrays for a signal, reusing the cached result if the
+        buffer has not grown since it was computed.
+        """
+        cached = self._ds_cache.get(name)
+        if cached is not None and cached[0] is buf and cached[1] == len(buf):
+            return cached[2], cached[3]
+
+        # Peak-preserving downsample before handing data to pyqtgraph
+        x, y = m4_downsample(buf.timestamps, buf.values, self._max_points)
+
+        if time_offset is not None:
+            x = x - time_offset
+
+        self._ds_cache[name] = (buf, len(buf), x, y)
+        return x, y
+
+    def drop_cached_arrays(self) -> None:
+        """Forget downsampled arrays, e.g. after the buffers were replaced."""
+        self._ds_cache.clear()
+
+    def clear(self) -> None:
+        """Remove every plot item and forget all cached arrays."""
+        for item in self.items.values():
+            self._plot_widget.removeItem(item)
+
+        self.items.clear()
+        self._plotted.clear()
+        self._ds_cache.clear()
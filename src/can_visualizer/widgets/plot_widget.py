@@ -7,7 +7,6 @@ with zoom, pan, and multiple signal overlay support.
 
 import time
 from typing import Optional
-import numpy as np
 from PySide6.QtCore import Qt, Signal, Slot, QTimer
 from PySide6.QtWidgets import (
     QWidget,
@@ -24,7 +23,9 @@ import pyqtgraph as pg
 
 from ..core.models import DecodedSignal
 from ..core.data_store import DataStore
+from ..core.signal_buffer import SignalBuffer
 from ..utils.logging_config import get_logger
+from .plot_curves import PlotCurves
 
 logger = get_logger("plot")
 
@@ -83,8 +84,8 @@ class PlotWidget(QWidget):
         self._data_store = data_store
 
         # Storage for currently selected signals only
-        # Dict[signal_name, tuple[list[timestamps], list[values]]]
-        self._signal_data: dict[str, tuple[list[float], list[float]]] = {}
+        # Dict[signal_name, SignalBuffer]
+        self._signal_data: dict[str, SignalBuffer] = {}
 
         # Track last loaded timestamp per signal for incremental updates
         # Dict[signal_name, float]
@@ -93,10 +94,6 @@ class PlotWidget(QWidget):
         # Time offset for elapsed time display (first timestamp = 0)
         self._time_offset: Optional[float] = None
 
-        self._plot_items: dict[str, pg.PlotDataItem] = {}
-        self._selected_signals: list[str] = []
-        self._custom_colors: dict[str, str] = {}  # signal_name -> hex color
-
         # Crosshair and tooltip components
         self._vline: Optional[pg.InfiniteLine] = None
         self._hline: Optional[pg.InfiniteLine] = None
@@ -117,6 +114,10 @@ class PlotWidget(QWidget):
         self._auto_update_timer.start()
 
         self._setup_ui()
+        # Plot items, pens and downsample cache for the selected signals
+        self._curves = PlotCurves(
+            self._plot_widget, self._legend, self.COLORS, self.MAX_POINTS
+        )
         self._setup_crosshair()
         self._setup_legend_context_menu()
 
@@ -191,7 +192,8 @@ class PlotWidget(QWidget):
 
         # Configure for performance
         self._plot_widget.setClipToView(True)
-        self._plot_widget.setDownsampling(auto=True, mode="peak")
+        # Data is already M4-downsampled; pyqtgraph's own pass would redo it
+        self._plot_widget.setDownsampling(ds=1, auto=False)
 
         layout.addWidget(self._plot_widget)
 
@@ -237,9 +239,6 @@ class PlotWidget(QWidget):
             slot=self._on_mouse_moved,
         )
 
-        # Hide crosshair when mouse leaves
-        self._plot_widget.scene().sigMouseMoved.connect(self._check_mouse_in_plot)
-
     def _setup_legend_context_menu(self) -> None:
         """Setup right-click context menu on legend items."""
         self._context_menu_signal: Optional[str] = None
@@ -286,14 +285,14 @@ class PlotWidget(QWidget):
         for sample, label in self._legend.items:
             if item == sample or item == label:
                 short_name = label.text
-                for full_name in self._selected_signals:
-                    if full_name.split(".")[-1] == short_name:
+                for full_name, name in self._curves.short_names.items():
+                    if name == short_name:
                         return full_name
         return None
 
     def _find_signal_from_plot_item(self, item) -> Optional[str]:
         """Find the signal name corresponding to a clicked plot curve."""
-        for signal_name, plot_item in self._plot_items.items():
+        for signal_name, plot_item in self._curves.items.items():
             if item == plot_item:
                 return signal_name
             if hasattr(plot_item, "curve") and item == plot_item.curve:
@@ -310,7 +309,7 @@ class PlotWidget(QWidget):
         set_color_action = menu.addAction("🎨 Set Color...")
         set_color_action.triggered.connect(self._on_set_color)
 
-        if signal_name in self._custom_colors:
+        if signal_name in self._curves.custom_colors:
             menu.addSeparator()
             reset_action = menu.addAction("↩️ Reset to Default")
             reset_action.triggered.connect(self._on_reset_color)
@@ -323,18 +322,17 @@ class PlotWidget(QWidget):
             return
 
         signal_name = self._context_menu_signal
-        if signal_name in self._custom_colors:
-            initial_color = QColor(self._custom_colors[signal_name])
-        else:
-            signal_idx = self._selected_signals.index(signal_name)
-            initial_color = QColor(self.COLORS[signal_idx % len(self.COLORS)])
+        signal_idx = self._curves.selected.index(signal_name)
+        initial_color = QColor(self._curves.signal_color(signal_idx, signal_name))
 
         color = QColorDialog.getColor(
-            initial_color, self, f"Select Color for {signal_name.split('.')[-1]}"
+            initial_color,
+            self,
+            f"Select Color for {self._curves.short_names[signal_name]}",
         )
 
         if color.isValid():
-            self._custom_colors[signal_name] = color.name()
+            self._curves.set_color(signal_name, color.name())
             self._update_plot()
 
     def _on_reset_color(self) -> None:
@@ -343,8 +341,8 @@ class PlotWidget(QWidget):
             return
 
         signal_name = self._context_menu_signal
-        if signal_name in self._custom_colors:
-            del self._custom_colors[signal_name]
+        if signal_name in self._curves.custom_colors:
+            self._curves.set_color(signal_name, "")
             self._update_plot()
 
     def _on_mouse_moved(self, evt) -> None:
@@ -371,32 +369,18 @@ class PlotWidget(QWidget):
 
         tooltip_lines = [f"Time: {x_pos:.6f} s"]
 
-        for name in self._selected_signals:
-            if name not in self._signal_data:
-                continue
+        # Plot x axis is elapsed time; buffers hold absolute timestamps
+        abs_x_pos = x_pos + (self._time_offset or 0.0)
 
-            timestamps, values = self._signal_data[name]
-            if not timestamps:
+        signal_data = self._signal_data
+        for name, signal_name in self._curves.short_names.items():
+            buf = signal_data.get(name)
+            if buf is None or not len(buf):
                 continue
 
-            x_arr = np.array(timestamps)
-            idx = np.searchsorted(x_arr, x_pos)
-
-            if idx == 0:
-                closest_idx = 0
-            elif idx >= len(x_arr):
-                closest_idx = len(x_arr) - 1
-            else:
-                if abs(x_arr[idx] - x_pos) < abs(x_arr[idx - 1] - x_pos):
-                    closest_idx = idx
-                else:
-                    closest_idx = idx - 1
+            timestamp, value = buf.nearest_sample(abs_x_pos)
 
-            value = values[closest_idx]
-            timestamp = x_arr[closest_idx]
-            signal_name = name.split(".")[-1]
-
-            dt = timestamp - x_pos
+            dt = timestamp - abs_x_pos
             if abs(dt) < 0.001:
                 tooltip_lines.append(f"{signal_name}: {value:.4g}")
             else:
@@ -421,12 +405,6 @@ class PlotWidget(QWidget):
         else:
             self._tooltip.hide()
 
-    def _check_mouse_in_plot(self, pos) -> None:
-        """Hide crosshair when mouse leaves plot area."""
-        plot_item = self._plot_widget.getPlotItem()
-        if not plot_item.sceneBoundingRect().contains(pos):
-            self._hide_crosshair()
-
     def _hide_crosshair(self) -> None:
         """Hide crosshair and tooltip."""
         if self._vline:
@@ -447,7 +425,7 @@ class PlotWidget(QWidget):
         Update which signals are displayed.
         Refreshes data from DataStore for newly selected signals.
         """
-        self._selected_signals = signal_names
+        self._curves.set_selected(signal_names)
 
         # Cleanup deselected signals from cache
         current_signals = set(self._signal_data.keys())
@@ -479,7 +457,9 @@ class PlotWidget(QWidget):
         if timestamps and self._time_offset is None:
             self._time_offset = timestamps[0]
 
-        self._signal_data[full_name] = (timestamps, values)
+        buf = SignalBuffer(max(len(timestamps), SignalBuffer.INITIAL_CAPACITY))
+        buf.extend(timestamps, values)
+        self._signal_data[full_name] = buf
         if timestamps:
             self._last_loaded_ts[full_name] = timestamps[-1]
         else:
@@ -498,12 +478,12 @@ class PlotWidget(QWidget):
         """
         Periodically check for fresh data for *selected* signals.
         """
-        if not self._selected_signals:
+        if not self._curves.selected:
             return
 
         updated = False
 
-        for full_name in self._selected_signals:
+        for full_name in self._curves.selected:
             if full_name not in self._last_loaded_ts:
                 # Should have been initialized in set_selected_signals, but safe guard
                 self._load_data_for_signal(full_name)
@@ -523,9 +503,7 @@ class PlotWidget(QWidget):
 
             if new_ts:
                 # Append to existing
-                current_ts, current_val = self._signal_data[full_name]
-                current_ts.extend(new_ts)
-                current_val.extend(new_val)
+                self._signal_data[full_name].extend(new_ts, new_val)
 
                 self._last_loaded_ts[full_name] = new_ts[-1]
                 updated = True
@@ -555,62 +533,12 @@ class PlotWidget(QWidget):
 
     def _update_plot(self) -> None:
         """Refresh plot with current data and selection."""
-        # Cleanup plot items
-        for name in list(self._plot_items.keys()):
-            if name not in self._selected_signals:
-                item = self._plot_items.pop(name)
-                self._plot_widget.removeItem(item)
-
-        total_points = 0
-
-        for i, name in enumerate(self._selected_signals):
-            if name not in self._signal_data:
-                continue
-
-            timestamps, values = self._signal_data[name]
-            if not timestamps:
-                continue
-
-            x = np.array(timestamps)
-            y = np.array(values)
-
-            # Convert to elapsed time (subtract first timestamp offset)
-            if self._time_offset is not None:
-                x = x - self._time_offset
-
-            # Downsample if needed (already handled by pyqtgraph auto downsample, but we can pre-clip)
-            # Actually pg downsampling usually handles this well.
-            # If we manually downsample, we save memory/transfer to GPU.
-            if len(x) > self.MAX_POINTS:
-                factor = len(x) // self.MAX_POINTS
-                x = x[::factor]
-                y = y[::factor]
-
-            total_points += len(x)
-
-            color = self._custom_colors.get(name) or self.COLORS[i % len(self.COLORS)]
-
-            if name in self._plot_items:
-                self._plot_items[name].setData(x, y)
-                self._plot_items[name].setPen(pg.mkPen(color=color, width=1.5))
-            else:
-                pen = pg.mkPen(color=color, width=1.5)
-                item = self._plot_widget.plot(
-                    x,
-                    y,
-                    pen=pen,
-                    name=name.split(".")[-1],
-                )
-                self._plot_items[name] = item
-
+        total_points = self._curves.update(self._signal_data, self._time_offset)
         self._point_label.setText(f"{total_points:,} points")
 
     def clear_plot(self) -> None:
         """Clear all plot data and items."""
-        for item in self._plot_items.values():
-            self._plot_widget.removeItem(item)
-
-        self._plot_items.clear()
+        self._curves.clear()
         self._signal_data.clear()
         self._last_loaded_ts.clear()
         self._time_offset = None  # Reset time offset
@@ -619,6 +547,7 @@ class PlotWidget(QWidget):
     def clear_data_only(self) -> None:
         """Clear data but keep signal selection."""
         self._signal_data.clear()
+        self._curves.drop_cached_arrays()
         self._last_loaded_ts.clear()
         self._time_offset = None  # Reset time offset
         self._update_plot()
@@ -659,21 +588,18 @@ class PlotWidget(QWidget):
     @property
     def total_points(self) -> int:
         """Get total data points across all signals."""
-        return sum(len(v[0]) for v in self._signal_data.values())
+        return sum(len(buf) for buf in self._signal_data.values())
 
     def set_signal_color(self, signal_name: str, color: str) -> None:
         """
         Set custom color for a signal (called externally).
         """
-        if color:
-            self._custom_colors[signal_name] = color
-        elif signal_name in self._custom_colors:
-            del self._custom_colors[signal_name]
+        self._curves.set_color(signal_name, color)
         self._update_plot()
 
     def get_custom_colors(self) -> dict[str, str]:
         """Get all custom color assignments."""
-        return self._custom_colors.copy()
+        return self._curves.custom_colors.copy()
 
     def update_theme(self, bg_color: str, fg_color: str) -> None:
         """
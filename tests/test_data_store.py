@@ -56,6 +56,14 @@ class TestDataStore(unittest.TestCase):
     def tearDown(self):
         self.store.close()
 
+    def test_get_signal_data(self):
+        timestamps, values = self.store.get_signal_data("SigA", message_name="Msg2")
+        self.assertEqual(list(timestamps), [3.0])
+        self.assertEqual(list(values), [30.0])
+
+        timestamps, values = self.store.get_signal_data("SigA", min_timestamp=1.0)
+        self.assertEqual(list(timestamps), [3.0])
+
     def test_total_count(self):
         self.assertEqual(self.store.get_total_count(), 4)
 
@@ -71,6 +79,12 @@ class TestDataStore(unittest.TestCase):
         self.assertEqual(fetched[0].timestamp, 1.0)
         self.assertEqual(fetched[1].timestamp, 2.0)
 
+    def test_fetch_offset(self):
+        fetched = list(self.store.fetch_data(limit=2, offset=1))
+        self.assertEqual([s.timestamp for s in fetched], [2.0, 3.0])
+        fetched = list(self.store.fetch_data(offset=3))
+        self.assertEqual([s.timestamp for s in fetched], [4.0])
+
     def test_fetch_paginated(self):
         # Page 1, size 2
         page1 = list(self.store.fetch_paginated_data(page=1, page_size=2))
@@ -88,6 +102,11 @@ class TestDataStore(unittest.TestCase):
         page3 = list(self.store.fetch_paginated_data(page=3, page_size=2))
         self.assertEqual(len(page3), 0)
 
+    def test_fetched_names_are_shared(self):
+        first, _, third, _ = self.store.fetch_data()
+        self.assertIs(first.signal_name, third.signal_name)
+        self.assertIs(first.unit, third.unit)
+
     def test_fetch_by_signal(self):
         sig_a = list(self.store.fetch_by_signal("SigA"))
         self.assertEqual(len(sig_a), 2)
@@ -0,0 +1,77 @@
+import sys
+import unittest
+from pathlib import Path
+
+# Add src to path to allow imports
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+import numpy as np
+
+from can_visualizer.core import downsample
+from can_visualizer.core.downsample import (
+    _bucket_extrema,
+    _bucket_extrema_numpy,
+    m4_downsample,
+)
+
+
+def reference_bucket_extrema(y, bucket, full):
+    """Per-bucket argmin/argmax with a plain Python loop."""
+    imin, imax = [], []
+    for b in range(full):
+        values = list(y[b * bucket : (b + 1) * bucket])
+        imin.append(values.index(min(values)))
+        imax.append(values.index(max(values)))
+    return imin, imax
+
+
+class TestM4Downsample(unittest.TestCase):
+    def test_small_input_unchanged(self):
+        x = np.arange(10, dtype=float)
+        y = x * 2
+        out_x, out_y = m4_downsample(x, y, max_points=100)
+        self.assertIs(out_x, x)
+        self.assertIs(out_y, y)
+
+    def test_output_bounded(self):
+        x = np.arange(100_003, dtype=float)
+        y = np.sin(x / 100)
+        out_x, out_y = m4_downsample(x, y, max_points=1000)
+        self.assertLessEqual(len(out_x), 1000 + 4)
+        self.assertEqual(len(out_x), len(out_y))
+        self.assertTrue(np.all(np.diff(out_x) >= 0))
+        self.assertEqual(out_x[0], 0)
+        self.assertEqual(out_x[-1], 100_002)
+
+    def test_spikes_preserved(self):
+        x = np.arange(50_000, dtype=float)
+        y = np.zeros_like(x)
+        y[12_345] = 100.0
+        y[33_333] = -50.0
+        out_x, out_y = m4_downsample(x, y, max_points=400)
+        self.assertEqual(out_y.max(), 100.0)
+        self.assertEqual(out_y.min(), -50.0)
+        self.assertIn(12_345, out_x)
+
+    def check_bucket_extrema(self, kernel):
+        rng = np.random.default_rng(7)
+        y = rng.standard_normal(64 * 37)
+        imin, imax = kernel(y, 64, 37)
+        ref_min, ref_max = reference_bucket_extrema(y, 64, 37)
+        np.testing.assert_array_equal(imin, ref_min)
+        np.testing.assert_array_equal(imax, ref_max)
+
+    def test_bucket_extrema_numpy(self):
+        self.check_bucket_extrema(_bucket_extrema_numpy)
+
+    @unittest.skipUnless(downsample.njit is not None, "numba not installed")
+    def test_bucket_extrema_numba(self):
+        self.assertIsNot(_bucket_extrema, _bucket_extrema_numpy)
+        self.check_bucket_extrema(_bucket_extrema)
+
+    def test_warm_up(self):
+        downsample.warm_up()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,270 @@
+import os
+import sys
+import unittest
+from pathlib import Path
+
+# Add src to path to allow imports
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import (
+    QPersistentModelIndex,
+    Qt,
+    qInstallMessageHandler,
+)
+from PySide6.QtTest import QAbstractItemModelTester, QTest
+from PySide6.QtWidgets import QApplication
+
+from can_visualizer.core.data_store import DataStore
+from can_visualizer.core.models import DecodedSignal
+from can_visualizer.widgets.log_table import (
+    LogTableWidget,
+    MessageLogFilterPanel,
+    SignalTableModel,
+)
+
+
+def make_signal(i: int, message_name: str, signal_name: str) -> DecodedSignal:
+    return DecodedSignal(
+        timestamp=float(i),
+        message_name=message_name,
+        message_id=0x100,
+        signal_name=signal_name,
+        raw_value=i,
+        physical_value=float(i),
+        unit="",
+    )
+
+
+class TestSignalTableModel(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.store = DataStore()
+        self.store.add_data(
+            [
+                make_signal(i, "Engine" if i % 2 else "Brake", f"Sig{i % 3}")
+                for i in range(10)
+            ]
+        )
+        self.model = SignalTableModel()
+        self.model.PAGE_SIZE = 4
+        self.model.set_data_store(self.store)
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_load_more_pages(self):
+        self.assertEqual(self.model.load_more(), 4)
+        self.assertEqual(self.model.load_more(), 4)
+        self.assertEqual(self.model.load_more(), 2)
+        self.assertEqual(self.model.load_more(), 0)
+        self.assertEqual(self.model.rowCount(), 10)
+        self.assertFalse(self.model.has_more())
+
+    def test_load_all_single_insert(self):
+        self.model.load_more()
+        inserted = []
+        self.model.rowsInserted.connect(
+            lambda parent, first, last: inserted.append((first, last))
+        )
+        self.model.load_all()
+        self.assertEqual(inserted, [(4, 9)])
+        self.assertFalse(self.model.has_more())
+
+    def test_load_more_after_short_page(self):
+        self.model.load_all()
+        self.store.add_data([make_signal(i, "Engine", "Sig0") for i in range(10, 13)])
+
+        self.assertTrue(self.model.has_more())
+        self.assertEqual(self.model.load_more(), 3)
+        self.assertEqual(self.model.get_signal(10).timestamp, 10.0)
+
+    def test_model_consistency(self):
+        warnings = []
+        previous = qInstallMessageHandler(
+            lambda mode, context, message: warnings.append(message)
+        )
+        try:
+            tester = QAbstractItemModelTester(
+                self.model, QAbstractItemModelTester.FailureReportingMode.Warning
+            )
+            self.model.load_more()
+            self.model.set_filter("engine")
+            self.model.load_more()
+            self.model.set_signal_filter(["Engine.Sig1"])
+            self.model.load_all()
+            self.model.clear()
+            del tester
+        finally:
+            qInstallMessageHandler(previous)
+        self.assertEqual(warnings, [])
+
+    def test_load_more_with_filter_inserts_filtered_rows(self):
+        self.assertFalse(self.model.has_text_filter)
+        self.model.set_filter("engine")
+        self.assertTrue(self.model.has_text_filter)
+        inserted = []
+        self.model.rowsInserted.connect(
+            lambda parent, first, last: inserted.append((first, last))
+        )
+
+        self.model.load_more()
+        self.model.load_more()
+        self.model.load_more()
+
+        self.assertEqual(self.model.rowCount(), 5)
+        self.assertEqual(inserted, [(0, 1), (2, 3), (4, 4)])
+        for row in range(self.model.rowCount()):
+            self.assertEqual(self.model.get_signal(row).message_name, "Engine")
+
+    def test_display_text(self):
+        self.model.load_more()
+        self.model.set_filter("engine")
+        row = [
+            self.model.data(self.model.index(0, col), Qt.ItemDataRole.DisplayRole)
+            for col in range(self.model.columnCount())
+        ]
+        self.assertEqual(row, ["1.000000", "Engine", "0x100", "Sig1", "1", "1", ""])
+
+    def test_foreground_color_per_message(self):
+        self.model.load_all()
+        colors = [
+            self.model.data(self.model.index(row, 0), Qt.ItemDataRole.ForegroundRole)
+            for row in range(self.model.rowCount())
+        ]
+        self.assertEqual(colors[1], colors[3])  # both Engine
+        self.assertEqual(colors[0], colors[2])  # both Brake
+
+    def test_unhandled_role(self):
+        self.model.load_more()
+        index = self.model.index(0, 0)
+        self.assertIsNone(self.model.data(index, Qt.ItemDataRole.ToolTipRole))
+        self.assertIsNone(self.model.data(index, Qt.ItemDataRole.BackgroundRole))
+
+    def test_text_alignment(self):
+        self.model.load_more()
+        right = self.model.data(
+            self.model.index(0, 0), Qt.ItemDataRole.TextAlignmentRole
+        )
+        left = self.model.data(
+            self.model.index(0, 1), Qt.ItemDataRole.TextAlignmentRole
+        )
+        self.assertTrue(right & Qt.AlignmentFlag.AlignRight)
+        self.assertTrue(left & Qt.AlignmentFlag.AlignLeft)
+
+    def test_filter_keeps_persistent_indices(self):
+        self.model.load_all()
+        engine = QPersistentModelIndex(self.model.index(5, 2))
+        brake = QPersistentModelIndex(self.model.index(4, 0))
+
+        self.model.set_filter("engine")
+        self.assertEqual((engine.row(), engine.column()), (2, 2))
+        self.assertFalse(brake.isValid())
+
+        self.model.set_filter("")
+        self.assertEqual(engine.row(), 5)
+
+    def test_signal_filter(self):
+        self.model.load_all()
+        self.model.set_signal_filter(["Brake.Sig0"])
+        rows = [self.model.get_signal(r) for r in range(self.model.rowCount())]
+        self.assertEqual([s.timestamp for s in rows], [0.0, 6.0])
+
+        changes = []
+        self.model.layoutChanged.connect(lambda: changes.append(True))
+        self.model.set_signal_filter(["Brake.Sig0"])
+        self.assertEqual(changes, [])
+
+        self.model.set_signal_filter([])
+        self.assertEqual(self.model.rowCount(), 10)
+
+
+class TestLogTableWidget(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.store = DataStore()
+        self.store.add_data(
+            [make_signal(i, f"Msg{i % 7}", f"Sig{i % 5}") for i in range(5000)]
+        )
+        self.widget = LogTableWidget(self.store)
+        self.widget._update_timer.stop()
+        self.widget.resize(800, 600)
+        self.widget.show()
+
+    def tearDown(self):
+        self.widget.close()
+        self.widget.deleteLater()
+        self.store.close()
+
+    def tick(self):
+        self.widget._check_for_updates()
+        # Longer than the scroll check interval, so a load it triggers lands
+        QTest.qWait(self.widget.SCROLL_CHECK_INTERVAL * 2)
+
+    def test_auto_scroll_follows_tail(self):
+        self.widget._auto_scroll_btn.click()
+        scrollbar = self.widget._table.verticalScrollBar()
+        for ticks in range(1, 4):
+            self.tick()
+            self.assertEqual(self.widget.loaded_count, ticks * 1000)
+            self.assertGreater(scrollbar.maximum(), 0)
+            self.assertEqual(scrollbar.value(), scrollbar.maximum())
+
+    def test_auto_scroll_keeps_position_after_user_scrolls_up(self):
+        self.widget._auto_scroll_btn.click()
+        scrollbar = self.widget._table.verticalScrollBar()
+        self.tick()
+        self.tick()
+
+        scrollbar.setValue(0)
+        QTest.qWait(self.widget.SCROLL_CHECK_INTERVAL * 2)
+        self.tick()
+        self.assertEqual(self.widget.loaded_count, 3000)
+        self.assertEqual(scrollbar.value(), 0)
+
+        # Returning to the bottom resumes following the tail
+        scrollbar.setValue(scrollbar.maximum())
+        QTest.qWait(self.widget.SCROLL_CHECK_INTERVAL * 2)
+        self.tick()
+        self.assertEqual(scrollbar.value(), scrollbar.maximum())
+
+    def test_auto_scroll_off_by_default(self):
+        self.assertFalse(self.widget._auto_scroll_btn.isChecked())
+        self.tick()
+        self.assertEqual(self.widget.loaded_count, 0)
+
+
+class TestMessageLogFilterPanel(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def listed(self, panel):
+        filters = panel._filters_list
+        return [
+            filters.item(row).data(Qt.ItemDataRole.UserRole)
+            for row in range(filters.count())
+        ]
+
+    def test_list_follows_filter_order(self):
+        panel = MessageLogFilterPanel()
+        panel.set_filter_signals(["A.a", "B.b", "C.c"])
+        kept = panel._list_items["B.b"]
+
+        panel.set_filter_signals(["Z.z", "B.b", "A.a", "Y.y"])
+        self.assertEqual(self.listed(panel), ["Z.z", "B.b", "A.a", "Y.y"])
+        self.assertIs(panel._list_items["B.b"], kept)
+
+        panel.add_filter_signals(["A.a", "Q.q"])
+        self.assertEqual(self.listed(panel), panel.get_filter_signals())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import sys
+import unittest
+from array import array
+from pathlib import Path
+
+# Add src to path to allow imports
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+import numpy as np
+
+from can_visualizer.core.signal_buffer import SignalBuffer
+
+
+class TestSignalBuffer(unittest.TestCase):
+    def test_append_grows_capacity(self):
+        buf = SignalBuffer(capacity=2)
+        for i in range(5):
+            buf.append(float(i), float(i * 10))
+
+        self.assertEqual(len(buf), 5)
+        self.assertGreaterEqual(buf.capacity, 5)
+        np.testing.assert_array_equal(buf.timestamps, [0, 1, 2, 3, 4])
+        np.testing.assert_array_equal(buf.values, [0, 10, 20, 30, 40])
+
+    def test_extend(self):
+        buf = SignalBuffer(capacity=4)
+        buf.extend([1.0, 2.0], [10.0, 20.0])
+        buf.extend([], [])
+        buf.extend(np.array([3.0, 4.0, 5.0]), np.array([30.0, 40.0, 50.0]))
+        buf.extend(array("d", [6.0]), array("d", [60.0]))
+
+        self.assertEqual(len(buf), 6)
+        np.testing.assert_array_equal(buf.timestamps, [1, 2, 3, 4, 5, 6])
+        np.testing.assert_array_equal(buf.values, [10, 20, 30, 40, 50, 60])
+
+    def test_copy_is_independent(self):
+        buf = SignalBuffer()
+        buf.extend([1.0, 2.0], [10.0, 20.0])
+
+        other = buf.copy()
+        buf.append(3.0, 30.0)
+
+        self.assertEqual(len(other), 2)
+        np.testing.assert_array_equal(other.values, [10, 20])
+
+    def test_nearest_index(self):
+        buf = SignalBuffer(capacity=2)
+        buf.extend([1.0, 2.0, 4.0], [10.0, 20.0, 40.0])
+
+        self.assertEqual(buf.nearest_index(0.0), 0)
+        self.assertEqual(buf.nearest_index(1.4), 0)
+        self.assertEqual(buf.nearest_index(2.0), 1)
+        self.assertEqual(buf.nearest_index(3.5), 2)
+        self.assertEqual(buf.nearest_index(9.0), 2)
+
+    def test_nearest_sample(self):
+        buf = SignalBuffer(capacity=2)
+        buf.extend([1.0, 2.0, 4.0], [10.0, 20.0, 40.0])
+
+        self.assertEqual(buf.nearest_sample(3.5), (4.0, 40.0))
+        self.assertIs(type(buf.nearest_sample(1.0)[1]), float)
+
+    def test_clear(self):
+        buf = SignalBuffer()
+        buf.extend([1.0, 2.0], [10.0, 20.0])
+        buf.clear()
+
+        self.assertEqual(len(buf), 0)
+        self.assertEqual(len(buf.timestamps), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()